@@ -6,192 +6,371 @@ Production-ready infrastructure validation
 """
 
 import asyncio
+import atexit
+import aiofiles
 import aiohttp
 import json
-import time
 import sys
-from typing import Dict, List, Any, Optional
-import subprocess
+import time
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 import logging
+import logging.handlers
+import queue
+from collections import defaultdict
+from dataclasses import dataclass
+from enum import IntFlag
+from functools import reduce
+from itertools import chain
+from operator import or_
+
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+    _json_loads = json.loads
 
-# Configure logging
+# Configure logging; records are handed to a listener thread so the
+# file handler's disk writes never block the event loop
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_file_handler = logging.FileHandler('/data/blockchain/nodes/mev_validation.log')
+_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handler.setFormatter(_formatter)
+_file_handler.setFormatter(_formatter)
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler, _file_handler)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('/data/blockchain/nodes/mev_validation.log')
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
+# Started with the handler so records logged by importers are not stranded
+# in the queue; stopping at exit flushes whatever is still queued
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
+JWT_SECRET_PATH = '/data/blockchain/storage/jwt-secret-common.hex'
+REPORT_PATH = '/data/blockchain/nodes/VALIDATION_REPORT.md'
+
+# Error bodies only end up in the report, so cap how much of one is read
+ERROR_BODY_LIMIT = 512
+
+async def _read_error_body(response: aiohttp.ClientResponse) -> str:
+    """Read a bounded prefix of a failed response's body"""
+    return (await response.content.read(ERROR_BODY_LIMIT)).decode('utf-8', 'replace')
+
+class Status(IntFlag):
+    """Probe outcome, stored as a bit so results can be OR-ed together"""
+    SUCCESS = 1
+    CONNECTED = 2
+    ERROR = 4
+    TIMEOUT = 8
+
+# Probe statuses that count as healthy / unhealthy
+_HEALTHY = Status.SUCCESS | Status.CONNECTED
+_UNHEALTHY = Status.ERROR | Status.TIMEOUT
+
+@dataclass(frozen=True, slots=True)
+class _ServiceEndpoints:
+    """Endpoint URLs probed for one service"""
+    rpc: Tuple[str, ...]
+    ws: Tuple[str, ...]
+    engine_api: str
+
+@dataclass(slots=True)
+class _ServiceSummary:
+    """Per-service health flags computed once per report"""
+    name: str
+    results: Dict[str, Any]
+    rpc_ok: bool
+    ws_ok: bool
+    mev_ok: bool
+    healthy: bool
+
 class MEVValidator:
+    RPC_HEADERS = {
+        'Content-Type': 'application/json',
+        'User-Agent': 'MEV-Validator/1.0'
+    }
+
+    # Basic eth_blockNumber probe
+    BLOCK_NUMBER_PAYLOAD = {
+        "jsonrpc": "2.0",
+        "method": "eth_blockNumber",
+        "params": ["latest"],
+        "id": 1
+    }
+    BLOCK_NUMBER_BODY = _json_dumps(BLOCK_NUMBER_PAYLOAD)
+
+    SUBSCRIBE_NEW_HEADS = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "eth_subscribe",
+        "params": ["newHeads"]
+    }
+
+    # Separate connect and read budgets so a dropped SYN fails in ~1s
+    PROBE_TIMEOUT = aiohttp.ClientTimeout(total=5, connect=1, sock_connect=1, sock_read=4)
+    WS_HANDSHAKE_TIMEOUT = 2
+    WS_RECEIVE_TIMEOUT = 3
+
+    # Seconds a successful eth_blockNumber probe is reused for
+    RPC_CACHE_TTL = 3.0
+
+    # Consecutive failures before an endpoint is skipped, and for how long
+    BREAKER_THRESHOLD = 3
+    BREAKER_COOLOFF = 30.0
+
     def __init__(self):
         self.endpoints = {
-            'erigon': {
-                'rpc': ['http://127.0.0.1:8545', 'http://127.0.0.1:8546'],
-                'ws': ['ws://127.0.0.1:8547'],
-                'engine_api': 'http://127.0.0.1:8547'
-            },
-            'reth': {
-                'rpc': ['http://127.0.0.1:8551'],
-                'ws': ['ws://127.0.0.1:18657'],
-                'engine_api': 'http://127.0.0.1:8553'
-            },
-            'geth': {
-                'rpc': ['http://127.0.0.1:8549'],
-                'ws': ['ws://127.0.0.1:8550'],
-                'engine_api': 'http://127.0.0.1:8554'
-            }
+            'erigon': _ServiceEndpoints(
+                rpc=('http://127.0.0.1:8545', 'http://127.0.0.1:8546'),
+                ws=('ws://127.0.0.1:8547',),
+                engine_api='http://127.0.0.1:8547'
+            ),
+            'reth': _ServiceEndpoints(
+                rpc=('http://127.0.0.1:8551',),
+                ws=('ws://127.0.0.1:18657',),
+                engine_api='http://127.0.0.1:8553'
+            ),
+            'geth': _ServiceEndpoints(
+                rpc=('http://127.0.0.1:8549',),
+                ws=('ws://127.0.0.1:8550',),
+                engine_api='http://127.0.0.1:8554'
+            )
         }
         
-        self.jwt_token = self._get_jwt_token()
+        self.jwt_token = ""
         self.results = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Bounds in-flight probes so concurrent validation doesn't burst the nodes
+        self._sem = asyncio.Semaphore(8)
+        self._rpc_cache: Dict[Tuple[str, str, tuple], Tuple[float, asyncio.Future]] = {}
+        self._breakers: Dict[str, Dict[str, float]] = defaultdict(lambda: {'fails': 0, 'open_until': 0.0})
+
+    async def __aenter__(self) -> "MEVValidator":
+        """Open the pooled HTTP session shared by all probes"""
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, limit_per_host=8, keepalive_timeout=60),
+            timeout=self.PROBE_TIMEOUT
+        )
+        self.jwt_token = await self._get_jwt_token()
+        return self
 
-    def _get_jwt_token(self) -> str:
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _get_jwt_token(self) -> str:
         """Read JWT token for authentication"""
         try:
-            with open('/data/blockchain/storage/jwt-secret-common.hex', 'r') as f:
-                return f.read().strip()
+            async with aiofiles.open(JWT_SECRET_PATH, 'r') as f:
+                return (await f.read()).strip()
         except Exception as e:
             logger.error(f"Failed to read JWT token: {e}")
             return ""
 
+    def _breaker_open(self, url: str) -> bool:
+        """Whether the endpoint's circuit breaker is currently skipping probes"""
+        return time.monotonic() < self._breakers[url]['open_until']
+
+    def _record_outcome(self, url: str, ok: bool) -> None:
+        """Update the endpoint's circuit breaker after a probe"""
+        breaker = self._breakers[url]
+        if ok:
+            breaker['fails'] = 0
+            return
+        breaker['fails'] += 1
+        if breaker['fails'] >= self.BREAKER_THRESHOLD:
+            breaker['open_until'] = time.monotonic() + self.BREAKER_COOLOFF
+
+    async def _through_breaker(self, url: str, probe, *args) -> Dict[str, Any]:
+        """Run a single-endpoint probe unless its circuit breaker is open"""
+        if self._breaker_open(url):
+            return {'status': Status.ERROR, 'error': 'circuit_open'}
+        result = await probe(*args)
+        self._record_outcome(url, bool(result['status'] & _HEALTHY))
+        return result
+
     async def test_rpc_endpoint(self, service: str, endpoint: str) -> Dict[str, Any]:
         """Test RPC endpoint functionality"""
-        try:
-            url = f"{endpoint}/"
-            headers = {
-                'Content-Type': 'application/json',
-                'User-Agent': 'MEV-Validator/1.0'
-            }
-            
-            # Test basic eth_blockNumber
-            payload = {
-                "jsonrpc": "2.0",
-                "method": "eth_blockNumber",
-                "params": ["latest"],
-                "id": 1
-            }
+        payload = self.BLOCK_NUMBER_PAYLOAD
+        key = (endpoint, payload['method'], tuple(payload['params']))
+        now = time.monotonic()
+        
+        # The latest block only moves every ~12s, so repeated probes of the same
+        # endpoint within the TTL share one request (including ones still in flight)
+        hit = self._rpc_cache.get(key)
+        if hit and now - hit[0] < self.RPC_CACHE_TTL:
+            return await asyncio.shield(hit[1])
+        
+        probe = asyncio.ensure_future(
+            self._through_breaker(endpoint, self._probe_rpc_endpoint, endpoint)
+        )
+        self._rpc_cache[key] = (now, probe)
+        result = await asyncio.shield(probe)
+        if result['status'] & _UNHEALTHY and self._rpc_cache.get(key, (None, None))[1] is probe:
+            del self._rpc_cache[key]
+        return result
+
+    async def _probe_rpc_endpoint(self, endpoint: str) -> Dict[str, Any]:
+        """Issue the eth_blockNumber probe against an RPC endpoint"""
+        async with self._sem:
+            try:
+                url = f"{endpoint}/"
+                started = time.perf_counter()
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=payload, headers=headers, timeout=10) as response:
+                async with self._session.post(url, data=self.BLOCK_NUMBER_BODY, headers=self.RPC_HEADERS) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = _json_loads(await response.read())
                         return {
-                            'status': 'success',
-                            'response_time': response.headers.get('response_time', 0),
+                            'status': Status.SUCCESS,
+                            'response_time': time.perf_counter() - started,
                             'data': data
                         }
                     else:
                         return {
-                            'status': 'error',
+                            'status': Status.ERROR,
                             'http_code': response.status,
-                            'error': await response.text()
+                            'error': await _read_error_body(response)
                         }
                         
-        except asyncio.TimeoutError:
-            return {'status': 'timeout', 'error': 'Request timeout'}
-        except Exception as e:
-            return {'status': 'error', 'error': str(e)}
+            except asyncio.TimeoutError:
+                return {'status': Status.TIMEOUT, 'error': 'Request timeout'}
+            except Exception as e:
+                return {'status': Status.ERROR, 'error': str(e)}
 
-    async def test_websocket_connection(self, service: str, ws_url: str) -> Dict[str, Any]:
-        """Test WebSocket connectivity"""
-        try:
-            import websockets
-            import asyncio
-            
-            headers = {
-                'User-Agent': 'MEV-Validator/1.0'
-            }
+    async def test_rpc_batch(self, service: str, endpoint: str,
+                             methods: List[Tuple[str, list]]) -> List[Dict[str, Any]]:
+        """Send several JSON-RPC calls to one endpoint as a single batch request"""
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(methods)
+        ]
+        if self._breaker_open(endpoint):
+            return [{'status': Status.ERROR, 'error': 'circuit_open'}] * len(methods)
+        
+        async with self._sem:
+            try:
+                url = f"{endpoint}/"
             
-            # Test WebSocket subscription
-            async with websockets.connect(
-                ws_url, 
-                timeout=10,
-                extra_headers=headers
-            ) as websocket:
-                # Subscribe to new block headers
-                subscribe_msg = {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "eth_subscribe",
-                    "params": ["newHeads"]
-                }
-                
-                await websocket.send(json.dumps(subscribe_msg))
+                async with self._session.post(url, data=_json_dumps(payload), headers=self.RPC_HEADERS) as response:
+                    if response.status != 200:
+                        self._record_outcome(endpoint, False)
+                        failure = {
+                            'status': Status.ERROR,
+                            'http_code': response.status,
+                            'error': await _read_error_body(response)
+                        }
+                        return [failure] * len(methods)
+                    data = _json_loads(await response.read())
                 
-                # Wait for subscription confirmation
-                try:
-                    response = await asyncio.wait_for(
-                        websocket.recv(), timeout=5
-                    )
-                    return {
-                        'status': 'connected',
-                        'response_time': 0.1,
-                        'subscription': 'active'
-                    }
-                except asyncio.TimeoutError:
-                    return {
-                        'status': 'connected',
-                        'subscription': 'pending'
-                    }
+            except asyncio.TimeoutError:
+                self._record_outcome(endpoint, False)
+                return [{'status': Status.TIMEOUT, 'error': 'Request timeout'}] * len(methods)
+            except Exception as e:
+                self._record_outcome(endpoint, False)
+                return [{'status': Status.ERROR, 'error': str(e)}] * len(methods)
+        
+        self._record_outcome(endpoint, True)
+        
+        # Batch responses may come back in any order; match them up by id
+        by_id = {item.get('id'): item for item in data} if isinstance(data, list) else {}
+        results = []
+        for i, (method, _) in enumerate(methods):
+            item = by_id.get(i)
+            if item is None:
+                results.append({'status': Status.ERROR, 'error': f'No response for {method}'})
+            elif 'error' in item:
+                # Some nodes return a bare string rather than a JSON-RPC error object
+                err = item['error']
+                results.append({'status': Status.ERROR, 'error': err.get('message', str(err)) if isinstance(err, dict) else str(err)})
+            else:
+                results.append({'status': Status.SUCCESS, 'data': item})
+        return results
+
+    async def test_websocket_connection(self, service: str, ws_url: str) -> Dict[str, Any]:
+        """Test WebSocket connectivity"""
+        return await self._through_breaker(ws_url, self._probe_websocket, ws_url)
+
+    async def _probe_websocket(self, ws_url: str) -> Dict[str, Any]:
+        """Open a WebSocket and subscribe to new block headers"""
+        async with self._sem:
+            try:
+                # Test WebSocket subscription over the shared session's connector
+                ws = await asyncio.wait_for(
+                    self._session.ws_connect(
+                        ws_url,
+                        headers={'User-Agent': self.RPC_HEADERS['User-Agent']}
+                    ),
+                    timeout=self.WS_HANDSHAKE_TIMEOUT
+                )
+                async with ws:
+                    # Subscribe to new block headers
+                    started = time.perf_counter()
+                    await ws.send_json(self.SUBSCRIBE_NEW_HEADS)
                     
-        except Exception as e:
-            return {'status': 'error', 'error': str(e)}
+                    # Wait for subscription confirmation
+                    try:
+                        await asyncio.wait_for(ws.receive(), timeout=self.WS_RECEIVE_TIMEOUT)
+                        return {
+                            'status': Status.CONNECTED,
+                            'response_time': time.perf_counter() - started,
+                            'subscription': 'active'
+                        }
+                    except asyncio.TimeoutError:
+                        return {
+                            'status': Status.CONNECTED,
+                            'subscription': 'pending'
+                        }
+                        
+            except Exception as e:
+                return {'status': Status.ERROR, 'error': str(e)}
 
     async def test_mev_functionality(self, service: str) -> Dict[str, Any]:
         """Test MEV-specific functionality"""
         results = {}
+        endpoints = self.endpoints.get(service)
         
         if service == 'erigon':
-            # Test Erigon-specific features
-            rpc_url = self.endpoints[service]['rpc'][0]
+            # Test Erigon-specific features: transaction pool, gas tracking
+            # and latest block in one round trip
+            rpc_url = endpoints.rpc[0]
             
-            # Test transaction pool
-            txpool_result = await self.test_rpc_endpoint(service, rpc_url)
+            txpool_result, gas_result, latest_result = await self.test_rpc_batch(
+                service, rpc_url,
+                [('txpool_status', []), ('eth_gasPrice', []), ('eth_blockNumber', [])]
+            )
             results['txpool'] = txpool_result
-            
-            # Test gas estimation
-            gas_result = await self.test_rpc_endpoint(service, rpc_url)
             results['gas_tracking'] = gas_result
-            
-            # Test latest block
-            latest_result = await self.test_rpc_endpoint(service, rpc_url)
             results['latest_block'] = latest_result
             
         elif service == 'reth':
-            # Test Reth Engine API
-            engine_url = self.endpoints[service]['engine_api']
-            
-            # Test engine API capabilities
-            engine_result = await self.test_rpc_endpoint(service, engine_url)
+            # Test Reth Engine API capabilities and Reth RPC
+            engine_result, rpc_result = await asyncio.gather(
+                self.test_rpc_endpoint(service, endpoints.engine_api),
+                self.test_rpc_endpoint(service, endpoints.rpc[0])
+            )
             results['engine_api'] = engine_result
-            
-            # Test Reth RPC
-            rpc_url = self.endpoints[service]['rpc'][0]
-            rpc_result = await self.test_rpc_endpoint(service, rpc_url)
             results['rpc'] = rpc_result
             
         elif service == 'geth':
-            # Test Geth MEV features
-            rpc_url = self.endpoints[service]['rpc'][0]
-            
-            # Test transaction pool
-            txpool_result = await self.test_rpc_endpoint(service, rpc_url)
+            # Test Geth MEV features: transaction pool and gas tracking in one
+            # round trip, alongside WebSocket connectivity and Auth RPC (Geth specific)
+            (txpool_result, gas_result), ws_result, auth_result = await asyncio.gather(
+                self.test_rpc_batch(
+                    service, endpoints.rpc[0],
+                    [('txpool_status', []), ('eth_gasPrice', [])]
+                ),
+                self.test_websocket_connection(service, endpoints.ws[0]),
+                self.test_rpc_endpoint(service, endpoints.engine_api)
+            )
             results['txpool'] = txpool_result
-            
-            # Test gas tracking
-            gas_result = await self.test_rpc_endpoint(service, rpc_url)
             results['gas_estimation'] = gas_result
-            
-            # Test WebSocket connectivity
-            ws_url = self.endpoints[service]['ws'][0]
-            ws_result = await self.test_websocket_connection(service, ws_url)
             results['websocket'] = ws_result
-            
-            # Test Auth RPC (Geth specific)
-            auth_result = await self.test_rpc_endpoint(service, 'http://127.0.0.1:8554')
             results['auth_rpc'] = auth_result
             
         return results
@@ -208,141 +387,131 @@ class MEVValidator:
             'overall_status': 'unknown'
         }
         
-        # Test RPC endpoints
-        if service in self.endpoints:
-            for rpc_url in self.endpoints[service]['rpc']:
-                result = await self.test_rpc_endpoint(service, rpc_url)
-                service_results['rpc_endpoints'].append({
-                    'url': rpc_url,
-                    **result
-                })
+        # Test RPC, WebSocket and MEV-specific functionality concurrently
+        endpoints = self.endpoints.get(service)
+        rpc_urls = endpoints.rpc if endpoints else ()
+        ws_urls = endpoints.ws if endpoints else ()
         
-        # Test WebSocket endpoints
-        if service in self.endpoints:
-            for ws_url in self.endpoints[service]['ws']:
-                result = await self.test_websocket_connection(service, ws_url)
-                service_results['websocket_endpoints'].append({
-                    'url': ws_url,
-                    **result
-                })
+        rpc_results, ws_results, mev_results = await asyncio.gather(
+            asyncio.gather(*(self.test_rpc_endpoint(service, url) for url in rpc_urls)),
+            asyncio.gather(*(self.test_websocket_connection(service, url) for url in ws_urls)),
+            self.test_mev_functionality(service)
+        )
         
-        # Test MEV-specific functionality
-        mev_results = await self.test_mev_functionality(service)
+        service_results['rpc_endpoints'] = [
+            {'url': url, **result} for url, result in zip(rpc_urls, rpc_results)
+        ]
+        service_results['websocket_endpoints'] = [
+            {'url': url, **result} for url, result in zip(ws_urls, ws_results)
+        ]
         service_results['mev_functionality'] = mev_results
         
         # Determine overall status
-        all_good = True
-        for category in ['rpc_endpoints', 'websocket_endpoints']:
-            for endpoint in service_results[category]:
-                if endpoint.get('status') != 'success':
-                    all_good = False
-                    break
-        
-        if mev_results:
-            for feature, result in mev_results.items():
-                if result.get('status') != 'success':
-                    all_good = False
-                    break
+        combined = reduce(
+            or_,
+            (result['status'] for result in chain(
+                service_results['rpc_endpoints'],
+                service_results['websocket_endpoints'],
+                mev_results.values()
+            )),
+            Status(0)
+        )
+        all_good = not combined & _UNHEALTHY
         
         service_results['overall_status'] = 'healthy' if all_good else 'degraded'
         self.results[service] = service_results
         
         return service_results
 
+    def _summarize(self, service_name: str, results: Dict[str, Any]) -> _ServiceSummary:
+        """Classify a service's probe results once for report rendering"""
+        return _ServiceSummary(
+            name=service_name,
+            results=results,
+            rpc_ok=all(ep['status'] & _HEALTHY for ep in results.get('rpc_endpoints', [])),
+            ws_ok=all(ep['status'] & _HEALTHY for ep in results.get('websocket_endpoints', [])),
+            mev_ok=all(r['status'] & _HEALTHY for r in results.get('mev_functionality', {}).values()),
+            healthy=results.get('overall_status') == 'healthy'
+        )
+
     def generate_report(self) -> str:
         """Generate comprehensive validation report"""
-        report = [
-            "# MEV Infrastructure Validation Report",
-            f"**Generated:** {time.strftime('%Y-%m-%d %H:%M:%S UTC')}",
-            "",
-            "## Executive Summary",
-            ""
-        ]
-        
-        healthy_count = sum(1 for s in self.results.values() if s.get('overall_status') == 'healthy')
-        total_count = len(self.results)
+        return "".join(self.iter_report()).rstrip("\n")
+
+    def iter_report(self) -> Iterator[str]:
+        """Yield the validation report in chunks so it can be streamed"""
+        summaries = [self._summarize(name, results) for name, results in self.results.items()]
+        healthy_count = sum(summary.healthy for summary in summaries)
+        total_count = len(summaries)
         
         if healthy_count == total_count:
-            report.append("✅ **ALL SYSTEMS HEALTHY** - Ready for Production MEV Operations")
-            report.append("")
+            headline = "✅ **ALL SYSTEMS HEALTHY** - Ready for Production MEV Operations"
         else:
-            report.append(f"⚠️  **{healthy_count}/{total_count} systems healthy** - Action Required")
-            report.append("")
+            headline = f"⚠️  **{healthy_count}/{total_count} systems healthy** - Action Required"
         
-        report.append("## Service Status Matrix")
-        report.append("| Service | RPC Endpoints | WebSocket | MEV Features | Overall Status |")
-        report.append("|---------|---------------|-----------|--------------|----------------|")
+        yield f"""# MEV Infrastructure Validation Report
+**Generated:** {time.strftime('%Y-%m-%d %H:%M:%S UTC')}
+
+## Executive Summary
+
+{headline}
+
+## Service Status Matrix
+| Service | RPC Endpoints | WebSocket | MEV Features | Overall Status |
+|---------|---------------|-----------|--------------|----------------|
+"""
         
-        for service_name, results in self.results.items():
-            rpc_status = "✅" if all(ep.get('status') == 'success' for ep in results.get('rpc_endpoints', [])) else "❌"
-            ws_status = "✅" if all(ep.get('status') == 'success' or ep.get('status') == 'connected' for ep in results.get('websocket_endpoints', [])) else "❌"
-            mev_status = "✅" if results.get('mev_functionality', {}).get('overall_status', 'healthy') else "⚠️"
-            overall_status = "✅ HEALTHY" if results.get('overall_status') == 'healthy' else "⚠️ DEGRADED"
-            
-            report.append(f"| {service_name} | {rpc_status} | {ws_status} | {mev_status} | {overall_status} |")
+        for summary in summaries:
+            yield (
+                f"| {summary.name} | {'✅' if summary.rpc_ok else '❌'} | {'✅' if summary.ws_ok else '❌'} "
+                f"| {'✅' if summary.mev_ok else '⚠️'} | {'✅ HEALTHY' if summary.healthy else '⚠️ DEGRADED'} |\n"
+            )
         
-        report.append("")
-        report.append("## Detailed Results")
-        report.append("")
+        yield "\n## Detailed Results\n"
         
-        for service_name, results in self.results.items():
-            report.append(f"### {service_name.upper()}")
-            report.append("")
+        for summary in summaries:
+            results = summary.results
+            yield f"\n### {summary.name.upper()}\n\n**RPC Endpoints:**\n"
+            for endpoint in results.get('rpc_endpoints', []):
+                status_emoji = "✅" if endpoint['status'] & _HEALTHY else "❌"
+                yield f"  {status_emoji} {endpoint['url']} - {endpoint['status'].name}\n"
             
-            report.append("**RPC Endpoints:**")
-            for i, endpoint in enumerate(results.get('rpc_endpoints', [])):
-                status_emoji = "✅" if endpoint['status'] == 'success' else "❌"
-                report.append(f"  {status_emoji} {endpoint['url']} - {endpoint['status'].upper()}")
-            
-            report.append("")
-            report.append("**WebSocket Endpoints:**")
-            for i, endpoint in enumerate(results.get('websocket_endpoints', [])):
-                status_emoji = "✅" if endpoint['status'] in ['success', 'connected'] else "❌"
-                report.append(f"  {status_emoji} {endpoint['url']} - {endpoint['status'].upper()}")
+            yield "\n**WebSocket Endpoints:**\n"
+            for endpoint in results.get('websocket_endpoints', []):
+                status_emoji = "✅" if endpoint['status'] & _HEALTHY else "❌"
+                yield f"  {status_emoji} {endpoint['url']} - {endpoint['status'].name}\n"
             
             if results.get('mev_functionality'):
-                report.append("")
-                report.append("**MEV Features:**")
+                yield "\n**MEV Features:**\n"
                 for feature, result in results['mev_functionality'].items():
-                    status_emoji = "✅" if result.get('status') == 'success' else "⚠️"
-                    report.append(f"  {status_emoji} {feature}: {result.get('status').upper()}")
+                    status_emoji = "✅" if result['status'] & _HEALTHY else "⚠️"
+                    yield f"  {status_emoji} {feature}: {result['status'].name}\n"
             
-            report.append("")
-            report.append(f"**Overall Status:** {results['overall_status'].upper()}")
+            yield f"\n**Overall Status:** {results['overall_status'].upper()}\n"
             
-            if results['overall_status'] != 'healthy':
-                report.append("")
-                report.append("**Issues Detected:**")
-                for category, items in results.items():
-                    if category in ['rpc_endpoints', 'websocket_endpoints']:
-                        for item in items:
-                            if item.get('status') != 'success':
-                                report.append(f"  - {item['url']}: {item.get('error', 'Unknown error'}")
-        
-        return "\n".join(report)
+            if not summary.healthy:
+                yield "\n**Issues Detected:**\n"
+                for item in chain(results['rpc_endpoints'], results['websocket_endpoints']):
+                    if item['status'] & _UNHEALTHY:
+                        yield f"  - {item['url']}: {item.get('error', 'Unknown error')}\n"
 
 async def main():
     """Main validation routine"""
     logger.info("🚀 Starting MEV Infrastructure Validation")
     
-    validator = MEVValidator()
-    
     # Validate all services
     services = ['erigon', 'reth', 'geth']
     
-    for service in services:
-        await validator.validate_service(service)
-        await asyncio.sleep(1)  # Brief pause between validations
-    
-    # Generate and display report
-    report = validator.generate_report()
-    print(report)
+    async with MEVValidator() as validator:
+        await asyncio.gather(*(validator.validate_service(service) for service in services))
     
-    # Save detailed results
-    with open('/data/blockchain/nodes/VALIDATION_REPORT.md', 'w') as f:
-        f.write(report)
+    # Display the report and save it as it is generated
+    async with aiofiles.open(REPORT_PATH, 'w') as f:
+        for chunk in validator.iter_report():
+            sys.stdout.write(chunk)
+            await f.write(chunk)
     
-    logger.info("📊 Validation report saved to /data/blockchain/nodes/VALIDATION_REPORT.md")
+    logger.info(f"📊 Validation report saved to {REPORT_PATH}")
     
     # Return results for programmatic use
     return validator.results
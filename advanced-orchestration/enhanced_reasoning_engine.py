@@ -7,10 +7,13 @@ Implements sophisticated decision-making and adaptive optimization
 import asyncio
 import json
 import math
+import time
 import numpy as np
+from collections import Counter, OrderedDict, defaultdict, deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Any, Callable
-from enum import Enum
+from typing import Deque, Dict, List, NamedTuple, Optional, Tuple, Any, Callable
+from enum import Enum, IntFlag
+from functools import partial
 import logging
 from datetime import datetime, timedelta
 
@@ -27,26 +30,92 @@ class DecisionType(Enum):
     RESOURCE_ALLOCATION = "resource_allocation"
     MARKET_ANALYSIS = "market_analysis"
 
-@dataclass
+@dataclass(slots=True)
+class HistoricalSeries:
+    """Market history stored column-wise, one array element per observation"""
+    prices: np.ndarray
+    volumes: np.ndarray
+    timestamps: np.ndarray
+    
+    @classmethod
+    def from_records(cls, records: List[Dict]) -> "HistoricalSeries":
+        """Build a series from a list of {"price", "volume", "timestamp"} dicts"""
+        return cls(
+            prices=np.fromiter((r.get("price", 0) for r in records), dtype=np.float64, count=len(records)),
+            volumes=np.fromiter((r.get("volume", 0) for r in records), dtype=np.float64, count=len(records)),
+            timestamps=np.fromiter((r.get("timestamp", 0) for r in records), dtype=np.float64, count=len(records))
+        )
+    
+    def __len__(self) -> int:
+        return self.prices.size
+
+@dataclass(slots=True)
 class Context:
     market_conditions: Dict[str, float]
     network_state: Dict[str, Any]
-    historical_data: List[Dict]
+    historical_data: HistoricalSeries
     current_resources: Dict[str, float]
     constraints: Dict[str, Any]
     timestamp: datetime = field(default_factory=datetime.now)
 
-@dataclass
+class RiskFlag(IntFlag):
+    """Risk factors from the engine's fixed vocabulary, combinable as a bitmask"""
+    HIGH_VOLATILITY = 1
+    LOW_LIQUIDITY = 2
+    NETWORK_CONGESTION = 4
+    HIGH_COMPETITION = 8
+    HIGH_PROFIT_VARIANCE = 16
+    LOW_SUCCESS_PROBABILITY = 32
+    UNKNOWN_DECISION_TYPE = 64
+    MARKET_UNCERTAINTY = 128
+
+_RISK_FLAG_LABELS = (
+    (RiskFlag.HIGH_VOLATILITY, "High market volatility"),
+    (RiskFlag.LOW_LIQUIDITY, "Low liquidity"),
+    (RiskFlag.NETWORK_CONGESTION, "Network congestion"),
+    (RiskFlag.HIGH_COMPETITION, "High competition"),
+    (RiskFlag.HIGH_PROFIT_VARIANCE, "High profit variance"),
+    (RiskFlag.LOW_SUCCESS_PROBABILITY, "Low success probability"),
+    (RiskFlag.UNKNOWN_DECISION_TYPE, "Unknown decision type"),
+    (RiskFlag.MARKET_UNCERTAINTY, "Market uncertainty"),
+)
+
+# Flag-driven recommendations, appended in table order when the flag is set
+_PREDICTIVE_RECOS = (
+    (RiskFlag.HIGH_PROFIT_VARIANCE, "Use smaller position sizes"),
+    (RiskFlag.LOW_SUCCESS_PROBABILITY, "Consider alternative strategies"),
+)
+
+_RISK_RECOS = (
+    (RiskFlag.HIGH_VOLATILITY, "Set tighter stop losses"),
+    (RiskFlag.LOW_LIQUIDITY, "Use smaller trade sizes"),
+    (RiskFlag.NETWORK_CONGESTION, "Increase gas price buffer"),
+    (RiskFlag.HIGH_COMPETITION, "Consider alternative timing"),
+)
+
+@dataclass(slots=True)
 class Decision:
     decision_type: DecisionType
     confidence: float
     reasoning: str
-    alternatives: List[Dict]
+    alternatives: List[Any]  # option dicts, or the Decisions an adaptive decision combined
     expected_outcome: Dict[str, float]
-    risk_factors: List[str]
+    risk_flags: RiskFlag
     recommendations: List[str]
+    # Free-form risk notes outside the RiskFlag vocabulary (e.g. strategy risk levels)
+    risk_notes: List[str] = field(default_factory=list)
+    
+    @property
+    def risk_factors(self) -> List[str]:
+        """Human-readable risk factors, materialized from the flags and notes"""
+        flags = self.risk_flags
+        return [label for flag, label in _RISK_FLAG_LABELS if flags & flag] + self.risk_notes
+    
+    @property
+    def risk_count(self) -> int:
+        return self.risk_flags.bit_count() + len(self.risk_notes)
 
-@dataclass
+@dataclass(slots=True)
 class Strategy:
     name: str
     parameters: Dict[str, Any]
@@ -56,13 +125,104 @@ class Strategy:
     resource_requirements: Dict[str, float]
     execution_time: float
 
+@dataclass(slots=True)
+class MarketModel:
+    kind: str
+    params: Dict[str, Any]
+
+@dataclass(slots=True)
+class Pattern:
+    count: int = 0
+    success_rate: float = 0.0
+    # Risk factor -> occurrences (seeded patterns hold prior weights instead)
+    common_factors: Counter = field(default_factory=Counter)
+
+class MonteCarloOutcomes(NamedTuple):
+    """Simulated outcomes, one array element per simulation"""
+    profit: np.ndarray
+    price_change: np.ndarray
+    gas_cost: np.ndarray
+
+# Strategies considered by reactive strategy selection
+_AVAILABLE_STRATEGIES = (
+    Strategy("arbitrage", {"slippage_tolerance": 0.005}, 0.8, 0.02, 0.3, {"cpu": 0.2}, 0.5),
+    Strategy("sandwich", {"front_run_gas": 150000}, 0.7, 0.03, 0.6, {"cpu": 0.4}, 0.8),
+    Strategy("liquidation", {"health_factor_threshold": 1.1}, 0.9, 0.05, 0.2, {"cpu": 0.1}, 0.3),
+    Strategy("flash_loan", {"borrow_amount": 1000}, 0.6, 0.04, 0.8, {"cpu": 0.5}, 1.0)
+)
+
+# Per-strategy scoring coefficients, aligned with _AVAILABLE_STRATEGIES, so all
+# strategies are scored in one array pass
+_STRATEGY_BASE_SCORES = np.array([s.success_probability for s in _AVAILABLE_STRATEGIES]) * 0.4
+_STRATEGY_VOLATILITY_WEIGHTS = np.array([0.2, 0.0, 0.0, 0.0])
+_STRATEGY_CONGESTION_WEIGHTS = np.array([0.0, 0.3, 0.0, 0.0])
+_STRATEGY_STRESS_WEIGHTS = np.array([0.0, 0.0, 0.3, 0.0])
+_STRATEGY_CPU = np.array([s.resource_requirements.get("cpu", 0.1) for s in _AVAILABLE_STRATEGIES])
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    # Serial on purpose: n is ~1000, and a parallel kernel entered from several
+    # executor threads at once aborts under Numba's workqueue threading layer
+    @njit(cache=True, fastmath=True)
+    def _mc_kernel_jit(price_change, gas_cost, base_profit, volatility, gas_price):
+        n = price_change.shape[0]
+        profit = np.empty(n)
+        for i in range(n):
+            price_change[i] *= volatility
+            gas_cost[i] = gas_price * (1.0 + gas_cost[i] * 0.1) * 0.001
+            profit[i] = base_profit * (1.0 + price_change[i]) - gas_cost[i]
+        return profit, price_change, gas_cost
+    
+    def _mc_kernel(rng, base_profit, volatility, gas_price, n):
+        """Fused Monte Carlo loop: returns (profit, price_change, gas_cost) arrays"""
+        # Samples come from the engine's generator so seeding still applies;
+        # the kernel scales them in place
+        return _mc_kernel_jit(rng.standard_normal(n), rng.standard_normal(n),
+                              base_profit, volatility, gas_price)
+else:
+    def _mc_kernel(rng, base_profit, volatility, gas_price, n):
+        """Vectorized Monte Carlo: returns (profit, price_change, gas_cost) arrays"""
+        # Scale standard normals in place so only the three returned arrays are allocated
+        price_change = rng.standard_normal(n)
+        price_change *= volatility
+        gas_cost = rng.standard_normal(n)
+        gas_cost *= 0.1
+        gas_cost += 1.0
+        gas_cost *= gas_price * 0.001
+        profit = price_change + 1.0
+        profit *= base_profit
+        profit -= gas_cost
+        return profit, price_change, gas_cost
+
+def _clamp(value: float, low: float, high: float) -> float:
+    """Clamp a scalar to [low, high]"""
+    return low if value < low else high if value > high else value
+
+def _uniq(first: List[str], second: List[str]) -> List[str]:
+    """Concatenate two lists, dropping duplicates while keeping first-seen order"""
+    return list(dict.fromkeys((*first, *second)))
+
 class EnhancedReasoningEngine:
-    def __init__(self):
+    # Enhanced contexts kept for reuse across decisions on the same context
+    ENHANCED_CACHE_SIZE = 32
+    # Smoothing factor for the per-key performance moving average
+    PERFORMANCE_EMA_ALPHA = 0.1
+    
+    def __init__(self, history_cap: int = 10_000):
         self.logger = logging.getLogger(__name__)
-        self.decision_history: List[Tuple[Context, Decision]] = []
-        self.performance_metrics: Dict[str, List[float]] = {}
-        self.learned_patterns: Dict[str, Dict] = {}
-        self.market_models: Dict[str, Any] = {}
+        self._enhanced_cache: "OrderedDict[Tuple[datetime, int], Tuple[Context, Context]]" = OrderedDict()
+        # Bounded so a long-running engine doesn't accumulate decisions forever
+        self.decision_history: Deque[Tuple[Context, Decision]] = deque(maxlen=history_cap)
+        # Recent confidences per decision key, oldest evicted automatically
+        self.performance_metrics: Dict[str, Deque[float]] = defaultdict(partial(deque, maxlen=100))
+        # Rolling mean of the same confidences, maintained incrementally for weighting
+        self._performance_ema: Dict[str, float] = {}
+        self.learned_patterns: Dict[str, Pattern] = {}
+        self.market_models: Dict[str, MarketModel] = {}
         
         # Initialize reasoning components
         self._initialize_reasoning_systems()
@@ -86,13 +246,19 @@ class EnhancedReasoningEngine:
         
         # Initialize pattern recognition
         self._initialize_pattern_recognition()
+        
+        # PCG64 generator for Monte Carlo draws (thread-safe via its internal lock)
+        self._rng = np.random.default_rng()
+        
+        # Warm up the Monte Carlo kernel so the first decision doesn't pay JIT compilation
+        _mc_kernel(self._rng, 0.0, 0.02, 20.0, 1)
     
     async def analyze_and_decide(self, context: Context, decision_type: DecisionType, 
                                reasoning_mode: ReasoningMode = ReasoningMode.ADAPTIVE) -> Decision:
         """
         Main reasoning interface - analyzes context and makes optimal decisions
         """
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         
         # Step 1: Context enhancement with market intelligence
         enhanced_context = await self._enhance_context(context)
@@ -101,43 +267,57 @@ class EnhancedReasoningEngine:
         reasoning_result = await self.reasoning_modes[reasoning_mode](enhanced_context, decision_type)
         
         # Step 3: Decision validation and risk assessment
-        validated_decision = await self._validate_decision(reasoning_result, enhanced_context)
+        validated_decision = self._validate_decision(reasoning_result, enhanced_context)
         
         # Step 4: Learn from decision for future optimization
-        await self._learn_from_decision(enhanced_context, validated_decision)
+        self._learn_from_decision(enhanced_context, validated_decision)
         
-        execution_time = (datetime.now() - start_time).total_seconds()
-        self.logger.info(f"Reasoning completed in {execution_time:.3f}s - Confidence: {validated_decision.confidence:.2f}")
+        execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+        self.logger.info("Reasoning completed in %.3fs - Confidence: %.2f",
+                         execution_time, validated_decision.confidence)
         
         return validated_decision
     
     async def _enhance_context(self, context: Context) -> Context:
         """Enhance context with market intelligence and predictive analytics"""
-        enhanced_context = Context(
-            market_conditions=context.market_conditions.copy(),
-            network_state=context.network_state.copy(),
-            historical_data=context.historical_data.copy(),
-            current_resources=context.current_resources.copy(),
-            constraints=context.constraints.copy(),
+        # Back-to-back decisions on the same context share one enhancement. The
+        # cached entry holds the original context, so its id can't be reused
+        key = (context.timestamp, id(context))
+        cached = self._enhanced_cache.get(key)
+        if cached is not None and cached[0] is context:
+            self._enhanced_cache.move_to_end(key)
+            return cached[1]
+        
+        enhanced_context = self._build_enhanced_context(context)
+        self._enhanced_cache[key] = (context, enhanced_context)
+        if len(self._enhanced_cache) > self.ENHANCED_CACHE_SIZE:
+            self._enhanced_cache.popitem(last=False)
+        return enhanced_context
+    
+    def _build_enhanced_context(self, context: Context) -> Context:
+        """Layer market and network predictions over a context"""
+        # Only the two enhanced dicts are rebuilt; the rest is read-only and shared
+        return Context(
+            # Add market intelligence
+            market_conditions={
+                **context.market_conditions,
+                "predicted_volatility": self._predict_volatility(context),
+                "market_sentiment": self._analyze_market_sentiment(context),
+                "liquidity_score": self._calculate_liquidity_score(context),
+                "competition_level": self._assess_competition(context)
+            },
+            # Add network intelligence
+            network_state={
+                **context.network_state,
+                "predicted_gas_price": self._predict_gas_price(context),
+                "mempool_congestion": self._analyze_mempool_congestion(context),
+                "block_time_prediction": self._predict_block_time(context)
+            },
+            historical_data=context.historical_data,
+            current_resources=context.current_resources,
+            constraints=context.constraints,
             timestamp=context.timestamp
         )
-        
-        # Add market intelligence
-        enhanced_context.market_conditions.update({
-            "predicted_volatility": await self._predict_volatility(context),
-            "market_sentiment": await self._analyze_market_sentiment(context),
-            "liquidity_score": await self._calculate_liquidity_score(context),
-            "competition_level": await self._assess_competition(context)
-        })
-        
-        # Add network intelligence
-        enhanced_context.network_state.update({
-            "predicted_gas_price": await self._predict_gas_price(context),
-            "mempool_congestion": await self._analyze_mempool_congestion(context),
-            "block_time_prediction": await self._predict_block_time(context)
-        })
-        
-        return enhanced_context
     
     async def _reactive_reasoning(self, context: Context, decision_type: DecisionType) -> Decision:
         """Reactive reasoning for immediate response to market conditions"""
@@ -161,9 +341,12 @@ class EnhancedReasoningEngine:
     
     async def _adaptive_reasoning(self, context: Context, decision_type: DecisionType) -> Decision:
         """Adaptive reasoning that learns and evolves strategies"""
-        # Combine multiple reasoning approaches
-        reactive_result = await self._reactive_reasoning(context, decision_type)
-        predictive_result = await self._predictive_reasoning(context, decision_type)
+        # Combine multiple reasoning approaches; the predictive pass waits on the
+        # Monte Carlo executor, so run the reactive pass alongside it
+        reactive_result, predictive_result = await asyncio.gather(
+            self._reactive_reasoning(context, decision_type),
+            self._predictive_reasoning(context, decision_type)
+        )
         
         # Weighted combination based on historical performance
         reactive_weight = self._get_mode_performance_weight(ReasoningMode.REACTIVE, decision_type)
@@ -184,10 +367,11 @@ class EnhancedReasoningEngine:
             decision_type=decision_type,
             confidence=combined_confidence,
             reasoning=combined_reasoning,
-            alternatives=[reactive_result.__dict__, predictive_result.__dict__],
+            alternatives=[reactive_result, predictive_result],
             expected_outcome=self._merge_outcomes(reactive_result.expected_outcome, 
                                                 predictive_result.expected_outcome),
-            risk_factors=list(set(reactive_result.risk_factors + predictive_result.risk_factors)),
+            risk_flags=reactive_result.risk_flags | predictive_result.risk_flags,
+            risk_notes=_uniq(reactive_result.risk_notes, predictive_result.risk_notes),
             recommendations=self._merge_recommendations(reactive_result.recommendations, 
                                                       predictive_result.recommendations)
         )
@@ -209,7 +393,8 @@ class EnhancedReasoningEngine:
             reasoning=f"Strategic analysis: {best_option['reasoning']}",
             alternatives=strategic_options,
             expected_outcome=best_option["expected_outcome"],
-            risk_factors=best_option["risk_factors"],
+            risk_flags=RiskFlag(0),
+            risk_notes=best_option["risk_factors"],
             recommendations=best_option["recommendations"]
         )
     
@@ -224,24 +409,25 @@ class EnhancedReasoningEngine:
         net_profit = potential_profit - gas_cost
         
         # Risk factors
-        risk_factors = []
+        risk_flags = RiskFlag(0)
         if market_conditions.get("volatility", 0) > 0.05:
-            risk_factors.append("High market volatility")
+            risk_flags |= RiskFlag.HIGH_VOLATILITY
         if market_conditions.get("liquidity", 1.0) < 0.5:
-            risk_factors.append("Low liquidity")
+            risk_flags |= RiskFlag.LOW_LIQUIDITY
         if context.network_state.get("congestion", 0) > 0.7:
-            risk_factors.append("Network congestion")
+            risk_flags |= RiskFlag.NETWORK_CONGESTION
+        risk_count = risk_flags.bit_count()
         
         # Confidence calculation
-        confidence = min(0.95, max(0.1, (net_profit * 10) - (len(risk_factors) * 0.2)))
+        confidence = _clamp((net_profit * 10) - (risk_count * 0.2), 0.1, 0.95)
         
         return Decision(
             decision_type=DecisionType.OPPORTUNITY_EVALUATION,
             confidence=confidence,
-            reasoning=f"Reactive evaluation: Net profit {net_profit:.4f} ETH with {len(risk_factors)} risk factors",
+            reasoning=f"Reactive evaluation: Net profit {net_profit:.4f} ETH with {risk_count} risk factors",
             alternatives=[],
             expected_outcome={"profit": net_profit, "success_probability": confidence},
-            risk_factors=risk_factors,
+            risk_flags=risk_flags,
             recommendations=["Execute immediately" if confidence > 0.7 else "Monitor closely"]
         )
     
@@ -254,19 +440,22 @@ class EnhancedReasoningEngine:
         # Monte Carlo simulation for outcome prediction
         outcomes = await self._monte_carlo_simulation(context, n_simulations=1000)
         
-        expected_profit = np.mean([o["profit"] for o in outcomes])
-        profit_std = np.std([o["profit"] for o in outcomes])
-        success_rate = len([o for o in outcomes if o["profit"] > 0]) / len(outcomes)
+        net_profit = outcomes.profit
+        expected_profit = float(net_profit.mean())
+        profit_std = float(net_profit.std())
+        success_rate = float((net_profit > 0).mean())
         
         # Risk assessment
-        risk_factors = []
+        risk_flags = RiskFlag(0)
         if profit_std > abs(expected_profit) * 0.5:
-            risk_factors.append("High profit variance")
+            risk_flags |= RiskFlag.HIGH_PROFIT_VARIANCE
         if success_rate < 0.7:
-            risk_factors.append("Low success probability")
+            risk_flags |= RiskFlag.LOW_SUCCESS_PROBABILITY
         
-        # Confidence based on prediction accuracy
-        confidence = min(0.95, success_rate * 0.8 + (1 - profit_std / abs(expected_profit)) * 0.2)
+        # Confidence based on prediction accuracy; with no expected profit there
+        # is nothing to scale the spread against, so the variability term is 0
+        variability = profit_std / abs(expected_profit) if expected_profit else 0.0
+        confidence = min(0.95, success_rate * 0.8 + (1 - variability) * 0.2)
         
         return Decision(
             decision_type=DecisionType.OPPORTUNITY_EVALUATION,
@@ -274,38 +463,38 @@ class EnhancedReasoningEngine:
             reasoning=f"Predictive evaluation: {expected_profit:.4f} ETH expected profit with {success_rate:.2f} success rate",
             alternatives=[],
             expected_outcome={"profit": expected_profit, "success_probability": success_rate, "variance": profit_std},
-            risk_factors=risk_factors,
-            recommendations=self._generate_predictive_recommendations(expected_profit, success_rate, risk_factors)
+            risk_flags=risk_flags,
+            recommendations=self._generate_predictive_recommendations(expected_profit, success_rate, risk_flags)
         )
     
     async def _assess_risk_reactive(self, context: Context) -> Decision:
         """Reactive risk assessment for immediate decision making"""
         risk_score = 0.0
-        risk_factors = []
+        risk_flags = RiskFlag(0)
         
         # Market risk
         volatility = context.market_conditions.get("volatility", 0.02)
         if volatility > 0.05:
             risk_score += 0.3
-            risk_factors.append("High market volatility")
+            risk_flags |= RiskFlag.HIGH_VOLATILITY
         
         # Liquidity risk
         liquidity = context.market_conditions.get("liquidity_score", 1.0)
         if liquidity < 0.5:
             risk_score += 0.2
-            risk_factors.append("Low liquidity")
+            risk_flags |= RiskFlag.LOW_LIQUIDITY
         
         # Network risk
         congestion = context.network_state.get("mempool_congestion", 0)
         if congestion > 0.7:
             risk_score += 0.2
-            risk_factors.append("Network congestion")
+            risk_flags |= RiskFlag.NETWORK_CONGESTION
         
         # Competition risk
         competition = context.market_conditions.get("competition_level", 0.5)
         if competition > 0.8:
             risk_score += 0.3
-            risk_factors.append("High competition")
+            risk_flags |= RiskFlag.HIGH_COMPETITION
         
         risk_level = min(1.0, risk_score)
         confidence = 1.0 - risk_level * 0.3  # High confidence in risk assessment
@@ -313,131 +502,93 @@ class EnhancedReasoningEngine:
         return Decision(
             decision_type=DecisionType.RISK_ASSESSMENT,
             confidence=confidence,
-            reasoning=f"Reactive risk assessment: {risk_level:.2f} risk level with {len(risk_factors)} factors",
+            reasoning=f"Reactive risk assessment: {risk_level:.2f} risk level with {risk_flags.bit_count()} factors",
             alternatives=[],
             expected_outcome={"risk_level": risk_level, "mitigation_required": risk_level > 0.5},
-            risk_factors=risk_factors,
-            recommendations=self._generate_risk_mitigation_recommendations(risk_level, risk_factors)
+            risk_flags=risk_flags,
+            recommendations=self._generate_risk_mitigation_recommendations(risk_level, risk_flags)
         )
     
     async def _select_strategy_reactive(self, context: Context) -> Decision:
         """Reactive strategy selection based on current conditions"""
-        available_strategies = [
-            Strategy("arbitrage", {"slippage_tolerance": 0.005}, 0.8, 0.02, 0.3, {"cpu": 0.2}, 0.5),
-            Strategy("sandwich", {"front_run_gas": 150000}, 0.7, 0.03, 0.6, {"cpu": 0.4}, 0.8),
-            Strategy("liquidation", {"health_factor_threshold": 1.1}, 0.9, 0.05, 0.2, {"cpu": 0.1}, 0.3),
-            Strategy("flash_loan", {"borrow_amount": 1000}, 0.6, 0.04, 0.8, {"cpu": 0.5}, 1.0)
-        ]
+        available_strategies = _AVAILABLE_STRATEGIES
         
-        # Score strategies based on current conditions
-        strategy_scores = []
-        for strategy in available_strategies:
-            score = await self._score_strategy(strategy, context)
-            strategy_scores.append((strategy, score))
+        # Score all strategies at once based on current conditions
+        volatility = context.market_conditions.get("volatility", 0.02)
+        congestion = context.network_state.get("mempool_congestion", 0)
+        market_stress = 1 - context.market_conditions.get("market_sentiment", 0.5)
+        available_cpu = context.current_resources.get("cpu", 1.0)
+        
+        scores = (_STRATEGY_BASE_SCORES
+                  + (volatility * 10) * _STRATEGY_VOLATILITY_WEIGHTS  # Higher volatility = better arbitrage
+                  + congestion * _STRATEGY_CONGESTION_WEIGHTS         # Higher congestion = better sandwich opportunities
+                  + market_stress * _STRATEGY_STRESS_WEIGHTS)         # Market stress increases liquidation opportunities
+        # Penalty for insufficient resources
+        scores = np.minimum(1.0, np.where(_STRATEGY_CPU > available_cpu, scores * 0.5, scores))
         
         # Select best strategy
-        best_strategy, best_score = max(strategy_scores, key=lambda x: x[1])
+        best_index = int(scores.argmax())
+        best_strategy = available_strategies[best_index]
+        best_score = float(scores[best_index])
         
         return Decision(
             decision_type=DecisionType.STRATEGY_SELECTION,
             confidence=best_score,
             reasoning=f"Selected {best_strategy.name} with score {best_score:.2f}",
-            alternatives=[{"strategy": s.name, "score": score} for s, score in strategy_scores],
+            alternatives=[{"strategy": s.name, "score": float(score)} for s, score in zip(available_strategies, scores)],
             expected_outcome={"strategy": best_strategy.name, "expected_profit": best_strategy.expected_profit},
-            risk_factors=[f"Strategy risk level: {best_strategy.risk_level:.2f}"],
+            risk_flags=RiskFlag(0),
+            risk_notes=[f"Strategy risk level: {best_strategy.risk_level:.2f}"],
             recommendations=[f"Execute {best_strategy.name} with parameters: {best_strategy.parameters}"]
         )
     
-    async def _score_strategy(self, strategy: Strategy, context: Context) -> float:
-        """Score a strategy based on current context"""
-        score = strategy.success_probability * 0.4
-        
-        # Adjust for market conditions
-        if strategy.name == "arbitrage":
-            volatility = context.market_conditions.get("volatility", 0.02)
-            score += (volatility * 10) * 0.2  # Higher volatility = better arbitrage
-        
-        elif strategy.name == "sandwich":
-            congestion = context.network_state.get("mempool_congestion", 0)
-            score += congestion * 0.3  # Higher congestion = better sandwich opportunities
-        
-        elif strategy.name == "liquidation":
-            market_stress = context.market_conditions.get("market_sentiment", 0.5)
-            score += (1 - market_stress) * 0.3  # Market stress increases liquidation opportunities
-        
-        # Adjust for resource availability
-        required_cpu = strategy.resource_requirements.get("cpu", 0.1)
-        available_cpu = context.current_resources.get("cpu", 1.0)
-        if required_cpu > available_cpu:
-            score *= 0.5  # Penalty for insufficient resources
+    async def _monte_carlo_simulation(self, context: Context, n_simulations: int = 1000) -> MonteCarloOutcomes:
+        """Monte Carlo simulation for outcome prediction"""
+        base_profit = context.market_conditions.get("price_difference", 0)
+        volatility = context.market_conditions.get("volatility", 0.02)
+        gas_price = context.network_state.get("predicted_gas_price", 20)
         
-        return min(1.0, score)
+        # Run the kernel off the event loop so other coroutines keep progressing
+        loop = asyncio.get_running_loop()
+        profit, price_change, gas_cost = await loop.run_in_executor(
+            None, _mc_kernel, self._rng, float(base_profit), float(volatility), float(gas_price), n_simulations
+        )
+        return MonteCarloOutcomes(profit=profit, price_change=price_change, gas_cost=gas_cost)
     
-    async def _monte_carlo_simulation(self, context: Context, n_simulations: int = 1000) -> List[Dict]:
-        """Monte Carlo simulation for outcome prediction"""
-        outcomes = []
-        
-        for _ in range(n_simulations):
-            # Simulate market conditions
-            price_change = np.random.normal(0, context.market_conditions.get("volatility", 0.02))
-            gas_price_change = np.random.normal(0, 0.1)
-            
-            # Calculate simulated profit
-            base_profit = context.market_conditions.get("price_difference", 0)
-            simulated_profit = base_profit * (1 + price_change)
-            
-            # Calculate costs
-            gas_cost = context.network_state.get("predicted_gas_price", 20) * (1 + gas_price_change) * 0.001
-            
-            net_profit = simulated_profit - gas_cost
-            
-            outcomes.append({
-                "profit": net_profit,
-                "success": net_profit > 0,
-                "price_change": price_change,
-                "gas_cost": gas_cost
-            })
-        
-        return outcomes
-    
-    async def _predict_volatility(self, context: Context) -> float:
+    def _predict_volatility(self, context: Context) -> float:
         """Predict market volatility using historical data"""
-        if not context.historical_data:
+        # Simple volatility prediction using recent relative price changes
+        prices = context.historical_data.prices[-100:]
+        prev_prices = prices[:-1]
+        valid = prev_prices > 0
+        if not valid.any():
             return 0.02  # Default volatility
         
-        # Simple volatility prediction using recent price changes
-        price_changes = []
-        for i in range(1, min(len(context.historical_data), 100)):
-            curr_price = context.historical_data[i].get("price", 0)
-            prev_price = context.historical_data[i-1].get("price", 0)
-            if prev_price > 0:
-                price_changes.append(abs(curr_price - prev_price) / prev_price)
-        
-        return np.mean(price_changes) if price_changes else 0.02
+        return float((np.abs(np.diff(prices)[valid]) / prev_prices[valid]).mean())
     
-    async def _analyze_market_sentiment(self, context: Context) -> float:
+    def _analyze_market_sentiment(self, context: Context) -> float:
         """Analyze market sentiment from various indicators"""
         # Simplified sentiment analysis
         sentiment_score = 0.5  # Neutral
+        history = context.historical_data
         
         # Analyze price trends
-        if len(context.historical_data) >= 10:
-            recent_prices = [d.get("price", 0) for d in context.historical_data[-10:]]
+        if len(history) >= 10:
+            recent_prices = history.prices[-10:]
             if recent_prices[-1] > recent_prices[0]:
                 sentiment_score += 0.2  # Positive trend
             else:
                 sentiment_score -= 0.2  # Negative trend
         
         # Analyze volume trends
-        if len(context.historical_data) >= 5:
-            recent_volumes = [d.get("volume", 0) for d in context.historical_data[-5:]]
-            avg_volume = np.mean(recent_volumes)
-            if recent_volumes[-1] > avg_volume * 1.2:
+        if len(history) >= 5:
+            recent_volumes = history.volumes[-5:]
+            if recent_volumes[-1] > recent_volumes.mean() * 1.2:
                 sentiment_score += 0.1  # High volume = strong sentiment
         
-        return max(0, min(1, sentiment_score))
+        return _clamp(sentiment_score, 0.0, 1.0)
     
-    async def _calculate_liquidity_score(self, context: Context) -> float:
+    def _calculate_liquidity_score(self, context: Context) -> float:
         """Calculate liquidity score based on market data"""
         # Simplified liquidity calculation
         base_liquidity = context.market_conditions.get("liquidity", 1.0)
@@ -446,9 +597,9 @@ class EnhancedReasoningEngine:
         spread = context.market_conditions.get("spread", 0.001)
         liquidity_score = base_liquidity * (1 - spread * 100)
         
-        return max(0, min(1, liquidity_score))
+        return _clamp(liquidity_score, 0.0, 1.0)
     
-    async def _assess_competition(self, context: Context) -> float:
+    def _assess_competition(self, context: Context) -> float:
         """Assess competition level for MEV opportunities"""
         # Simplified competition assessment
         base_competition = 0.5
@@ -464,9 +615,9 @@ class EnhancedReasoningEngine:
         congestion = context.network_state.get("mempool_congestion", 0)
         base_competition += congestion * 0.2
         
-        return max(0, min(1, base_competition))
+        return _clamp(base_competition, 0.0, 1.0)
     
-    async def _predict_gas_price(self, context: Context) -> float:
+    def _predict_gas_price(self, context: Context) -> float:
         """Predict future gas prices"""
         current_gas = context.network_state.get("gas_price", 20)
         congestion = context.network_state.get("mempool_congestion", 0)
@@ -476,7 +627,7 @@ class EnhancedReasoningEngine:
         
         return predicted_gas
     
-    async def _analyze_mempool_congestion(self, context: Context) -> float:
+    def _analyze_mempool_congestion(self, context: Context) -> float:
         """Analyze mempool congestion level"""
         # Simplified congestion analysis
         pending_txs = context.network_state.get("pending_transactions", 0)
@@ -486,7 +637,7 @@ class EnhancedReasoningEngine:
         
         return congestion
     
-    async def _predict_block_time(self, context: Context) -> float:
+    def _predict_block_time(self, context: Context) -> float:
         """Predict next block time"""
         # Simplified block time prediction
         base_block_time = 12.0  # Ethereum average
@@ -500,10 +651,7 @@ class EnhancedReasoningEngine:
     def _get_mode_performance_weight(self, mode: ReasoningMode, decision_type: DecisionType) -> float:
         """Get performance weight for a reasoning mode"""
         key = f"{mode.value}_{decision_type.value}"
-        if key in self.performance_metrics:
-            recent_performance = self.performance_metrics[key][-10:]  # Last 10 decisions
-            return np.mean(recent_performance) if recent_performance else 0.5
-        return 0.5  # Default weight
+        return self._performance_ema.get(key, 0.5)  # Default weight
     
     def _merge_outcomes(self, outcome1: Dict, outcome2: Dict) -> Dict:
         """Merge two outcome dictionaries"""
@@ -525,54 +673,35 @@ class EnhancedReasoningEngine:
     
     def _merge_recommendations(self, rec1: List[str], rec2: List[str]) -> List[str]:
         """Merge recommendation lists"""
-        return list(set(rec1 + rec2))
+        return _uniq(rec1, rec2)
     
-    def _generate_predictive_recommendations(self, expected_profit: float, success_rate: float, risk_factors: List[str]) -> List[str]:
+    def _generate_predictive_recommendations(self, expected_profit: float, success_rate: float, risk_flags: RiskFlag) -> List[str]:
         """Generate recommendations based on predictive analysis"""
-        recommendations = []
-        
         if expected_profit > 0.01 and success_rate > 0.8:
-            recommendations.append("High confidence execution recommended")
+            outlook = "High confidence execution recommended"
         elif expected_profit > 0.005 and success_rate > 0.6:
-            recommendations.append("Moderate execution with risk monitoring")
+            outlook = "Moderate execution with risk monitoring"
         else:
-            recommendations.append("Wait for better opportunities")
-        
-        if "High profit variance" in risk_factors:
-            recommendations.append("Use smaller position sizes")
-        
-        if "Low success probability" in risk_factors:
-            recommendations.append("Consider alternative strategies")
+            outlook = "Wait for better opportunities"
         
-        return recommendations
+        return [outlook] + [rec for flag, rec in _PREDICTIVE_RECOS if risk_flags & flag]
     
-    def _generate_risk_mitigation_recommendations(self, risk_level: float, risk_factors: List[str]) -> List[str]:
+    def _generate_risk_mitigation_recommendations(self, risk_level: float, risk_flags: RiskFlag) -> List[str]:
         """Generate risk mitigation recommendations"""
-        recommendations = []
-        
         if risk_level > 0.7:
-            recommendations.append("High risk - consider avoiding execution")
+            recommendations = ["High risk - consider avoiding execution"]
         elif risk_level > 0.5:
-            recommendations.append("Moderate risk - use reduced position size")
-        
-        if "High market volatility" in risk_factors:
-            recommendations.append("Set tighter stop losses")
-        
-        if "Low liquidity" in risk_factors:
-            recommendations.append("Use smaller trade sizes")
-        
-        if "Network congestion" in risk_factors:
-            recommendations.append("Increase gas price buffer")
-        
-        if "High competition" in risk_factors:
-            recommendations.append("Consider alternative timing")
+            recommendations = ["Moderate risk - use reduced position size"]
+        else:
+            recommendations = []
         
+        recommendations.extend(rec for flag, rec in _RISK_RECOS if risk_flags & flag)
         return recommendations
     
-    async def _validate_decision(self, decision: Decision, context: Context) -> Decision:
+    def _validate_decision(self, decision: Decision, context: Context) -> Decision:
         """Validate and refine decision quality"""
         # Validate confidence bounds
-        decision.confidence = max(0.1, min(0.95, decision.confidence))
+        decision.confidence = _clamp(decision.confidence, 0.1, 0.95)
         
         # Add validation reasoning
         validation_notes = []
@@ -582,81 +711,70 @@ class EnhancedReasoningEngine:
         elif decision.confidence > 0.8:
             validation_notes.append("High confidence - favorable conditions")
         
-        if decision.risk_factors:
-            validation_notes.append(f"Risk factors identified: {len(decision.risk_factors)}")
+        risk_count = decision.risk_count
+        if risk_count:
+            validation_notes.append(f"Risk factors identified: {risk_count}")
         
         if validation_notes:
             decision.reasoning += f" | Validation: {'; '.join(validation_notes)}"
         
         return decision
     
-    async def _learn_from_decision(self, context: Context, decision: Decision):
+    def _learn_from_decision(self, context: Context, decision: Decision):
         """Learn from decision outcomes to improve future reasoning"""
         # Store decision for future analysis
         self.decision_history.append((context, decision))
         
         # Update performance metrics (simplified)
         decision_key = f"{decision.decision_type.value}"
-        if decision_key not in self.performance_metrics:
-            self.performance_metrics[decision_key] = []
-        
         self.performance_metrics[decision_key].append(decision.confidence)
-        
-        # Keep only recent history
-        if len(self.performance_metrics[decision_key]) > 100:
-            self.performance_metrics[decision_key] = self.performance_metrics[decision_key][-100:]
+        self._performance_ema[decision_key] = (
+            (1 - self.PERFORMANCE_EMA_ALPHA) * self._performance_ema.get(decision_key, 0.5)
+            + self.PERFORMANCE_EMA_ALPHA * decision.confidence
+        )
         
         # Update learned patterns
-        await self._update_learned_patterns(context, decision)
+        self._update_learned_patterns(context, decision)
     
-    async def _update_learned_patterns(self, context: Context, decision: Decision):
+    def _update_learned_patterns(self, context: Context, decision: Decision):
         """Update learned patterns based on new decision"""
         # Create pattern signature
         pattern_key = f"{decision.decision_type.value}_{decision.confidence:.1f}"
         
-        if pattern_key not in self.learned_patterns:
-            self.learned_patterns[pattern_key] = {
-                "count": 0,
-                "success_rate": 0.0,
-                "common_factors": {}
-            }
-        
-        self.learned_patterns[pattern_key]["count"] += 1
+        pattern = self.learned_patterns.setdefault(pattern_key, Pattern())
+        pattern.count += 1
         
         # Update common factors
-        for factor in decision.risk_factors:
-            if factor not in self.learned_patterns[pattern_key]["common_factors"]:
-                self.learned_patterns[pattern_key]["common_factors"][factor] = 0
-            self.learned_patterns[pattern_key]["common_factors"][factor] += 1
+        pattern.common_factors.update(decision.risk_factors)
     
     def _create_volatility_model(self):
         """Create volatility prediction model"""
-        return {"model_type": "GARCH", "parameters": {"alpha": 0.1, "beta": 0.85}}
+        return MarketModel("GARCH", {"alpha": 0.1, "beta": 0.85})
     
     def _create_price_impact_model(self):
         """Create price impact estimation model"""
-        return {"model_type": "square_root", "parameters": {"lambda": 0.5}}
+        return MarketModel("square_root", {"lambda": 0.5})
     
     def _create_gas_price_model(self):
         """Create gas price prediction model"""
-        return {"model_type": "exponential_smoothing", "parameters": {"alpha": 0.3}}
+        return MarketModel("exponential_smoothing", {"alpha": 0.3})
     
     def _create_liquidity_model(self):
         """Create liquidity analysis model"""
-        return {"model_type": "depth_analysis", "parameters": {"depth_levels": [1, 5, 10]}}
+        return MarketModel("depth_analysis", {"depth_levels": [1, 5, 10]})
     
     def _initialize_pattern_recognition(self):
         """Initialize pattern recognition system"""
         # Initialize with common MEV patterns
         self.learned_patterns = {
-            "arbitrage_high_volatility": {
-                "success_rate": 0.8,
-                "common_factors": {"high_volatility": 0.9, "good_liquidity": 0.7}
-            },
-            "sandwich_congestion": {
-                "success_rate": 0.7,
-                "common_factors": {"network_congestion": 0.8, "high_gas": 0.6}
-            }
+            "arbitrage_high_volatility": Pattern(
+                success_rate=0.8,
+                common_factors=Counter({"high_volatility": 0.9, "good_liquidity": 0.7})
+            ),
+            "sandwich_congestion": Pattern(
+                success_rate=0.7,
+                common_factors=Counter({"network_congestion": 0.8, "high_gas": 0.6})
+            )
         }
     
     async def _default_reactive_decision(self, context: Context, decision_type: DecisionType) -> Decision:
@@ -667,7 +785,7 @@ class EnhancedReasoningEngine:
             reasoning="Default reactive decision - no specific handler",
             alternatives=[],
             expected_outcome={"status": "default"},
-            risk_factors=["Unknown decision type"],
+            risk_flags=RiskFlag.UNKNOWN_DECISION_TYPE,
             recommendations=["Manual review required"]
         )
     
@@ -679,7 +797,7 @@ class EnhancedReasoningEngine:
             reasoning="Default predictive decision - no specific handler",
             alternatives=[],
             expected_outcome={"status": "default"},
-            risk_factors=["Unknown decision type"],
+            risk_flags=RiskFlag.UNKNOWN_DECISION_TYPE,
             recommendations=["Implement specific handler"]
         )
     
@@ -712,7 +830,10 @@ class EnhancedReasoningEngine:
     async def _evaluate_strategic_options(self, options: List[Dict], context: Context) -> Dict:
         """Evaluate strategic options using multi-criteria analysis"""
         # Simplified evaluation - select based on risk-adjusted returns
-        best_option = max(options, key=lambda x: x["expected_return"] / (x["risk_level"] + 0.1))
+        n = len(options)
+        expected_returns = np.fromiter((o["expected_return"] for o in options), dtype=np.float64, count=n)
+        risk_levels = np.fromiter((o["risk_level"] for o in options), dtype=np.float64, count=n)
+        best_option = options[int(np.argmax(expected_returns / (risk_levels + 0.1)))]
         
         return {
             "confidence": 0.7,
@@ -733,7 +854,7 @@ class EnhancedReasoningEngine:
             reasoning="Predictive market analysis based on trend data",
             alternatives=[],
             expected_outcome=trend_analysis,
-            risk_factors=["Market uncertainty"],
+            risk_flags=RiskFlag.MARKET_UNCERTAINTY,
             recommendations=["Monitor key levels"]
         )
 
@@ -753,11 +874,11 @@ async def main():
             "congestion": 0.6,
             "pending_transactions": 50000
         },
-        historical_data=[
+        historical_data=HistoricalSeries.from_records([
             {"price": 1800, "volume": 1000000},
             {"price": 1820, "volume": 1200000},
             {"price": 1850, "volume": 1100000}
-        ],
+        ]),
         current_resources={
             "cpu": 0.7,
             "memory": 0.5
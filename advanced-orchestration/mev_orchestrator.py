@@ -7,11 +7,28 @@ Implements multi-agent coordination with adaptive planning
 import asyncio
 import json
 import time
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from collections import defaultdict, deque
+from dataclasses import dataclass, replace
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
 from enum import Enum
 import logging
 
+try:
+    import orjson
+    
+    def _format_result(result: Dict) -> str:
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2, default=str).decode()
+except ImportError:
+    def _format_result(result: Dict) -> str:
+        return json.dumps(result, indent=2, default=str)
+
+try:
+    import uvloop
+except ImportError:  # not available on Windows; fall back to the stock loop
+    uvloop = None
+
 class TaskType(Enum):
     OPPORTUNITY_DETECTION = "opportunity_detection"
     ARBITRAGE_EXECUTION = "arbitrage_execution"
@@ -25,7 +42,7 @@ class Priority(Enum):
     MEDIUM = 3
     LOW = 4
 
-@dataclass
+@dataclass(slots=True)
 class TaskNode:
     id: str
     task_type: TaskType
@@ -35,16 +52,113 @@ class TaskNode:
     required_resources: Dict[str, float]
     constraints: Dict[str, any]
 
-@dataclass
+@dataclass(slots=True)
 class Agent:
     id: str
-    capabilities: List[TaskType]
+    capabilities: FrozenSet[TaskType]
     current_load: float
     max_capacity: float
-    performance_history: Dict[str, float]
+    # Task type -> (total execution time, executions)
+    performance_history: Dict[TaskType, Tuple[float, int]]
+
+class ResourceAllocation(NamedTuple):
+    """Per-task resource demands, one array element per task in execution order"""
+    index: Dict[str, int]  # task id -> array position
+    cpu: np.ndarray
+    memory: np.ndarray
+    priority_weight: np.ndarray
+
+# Task graphs per opportunity type. _decompose_mev_opportunity copies each
+# node and fills in the per-opportunity constraints; the other fields are
+# shared between copies and must not be mutated.
+_ARBITRAGE_TEMPLATE = (
+    TaskNode(
+        id="risk_assessment_1",
+        task_type=TaskType.RISK_ASSESSMENT,
+        dependencies=[],
+        priority=Priority.CRITICAL,
+        estimated_complexity=0.1,
+        required_resources={"cpu": 0.1, "memory": 0.05},
+        constraints={"max_slippage": 0.005}
+    ),
+    TaskNode(
+        id="arbitrage_execution_1",
+        task_type=TaskType.ARBITRAGE_EXECUTION,
+        dependencies=["risk_assessment_1"],
+        priority=Priority.HIGH,
+        estimated_complexity=0.3,
+        required_resources={"cpu": 0.3, "memory": 0.2},
+        constraints={"gas_limit": 500000}
+    ),
+    TaskNode(
+        id="bundle_optimization_1",
+        task_type=TaskType.BUNDLE_OPTIMIZATION,
+        dependencies=["arbitrage_execution_1"],
+        priority=Priority.HIGH,
+        estimated_complexity=0.2,
+        required_resources={"cpu": 0.2, "memory": 0.1},
+        constraints={"target_profit": 0}
+    )
+)
+
+_SANDWICH_TEMPLATE = (
+    TaskNode(
+        id="risk_assessment_sandwich",
+        task_type=TaskType.RISK_ASSESSMENT,
+        dependencies=[],
+        priority=Priority.CRITICAL,
+        estimated_complexity=0.15,
+        required_resources={"cpu": 0.15, "memory": 0.1},
+        constraints={"victim_tx": None}
+    ),
+    TaskNode(
+        id="sandwich_execution_1",
+        task_type=TaskType.SANDWICH_EXECUTION,
+        dependencies=["risk_assessment_sandwich"],
+        priority=Priority.CRITICAL,
+        estimated_complexity=0.4,
+        required_resources={"cpu": 0.4, "memory": 0.3},
+        constraints={"front_run_gas": 150000, "back_run_gas": 100000}
+    )
+)
+
+# Placeholder transaction hashes returned by the simulated executors
+_DUMMY_TX_A = "0x" + "a" * 64
+_DUMMY_TX_B = "0x" + "b" * 64
+_DUMMY_TX_C = "0x" + "c" * 64
+_DUMMY_TX_D = "0x" + "d" * 64
+
+# CPU-bound task bodies. Module-level and side-effect free so they can run
+# in a worker process.
+
+def _assess_risk(constraints: Dict) -> Dict:
+    """Score the risk of a task from its constraints"""
+    risk_score = 0.15  # Simulated risk calculation
+    max_slippage = constraints.get("max_slippage", 0.01)
+    
+    return {
+        "status": "completed",
+        "risk_score": risk_score,
+        "recommendation": "proceed" if risk_score < max_slippage else "abort",
+        "confidence": 0.95
+    }
+
+def _optimize_bundle(constraints: Dict) -> Dict:
+    """Optimize a transaction bundle for the task's constraints"""
+    return {
+        "status": "completed",
+        "optimized_gas_price": 25,  # gwei
+        "bundle_hash": _DUMMY_TX_D,
+        "expected_profit": 0.028,  # ETH
+        "optimization_ratio": 1.15
+    }
 
 class AdvancedMEVOrchestrator:
-    def __init__(self):
+    def __init__(self, simulate: bool = False, cpu_workers: int = 0):
+        # When set, task executors sleep to mimic real execution latency
+        self._simulate = simulate
+        # Process pool for CPU-bound task bodies; with no workers they run inline
+        self._cpu_pool = ProcessPoolExecutor(max_workers=cpu_workers) if cpu_workers else None
         self.agents: Dict[str, Agent] = {}
         self.task_queue: List[TaskNode] = []
         self.active_tasks: Dict[str, TaskNode] = {}
@@ -58,38 +172,56 @@ class AdvancedMEVOrchestrator:
         # Initialize agents
         self._initialize_agents()
     
+    def close(self):
+        """Shut down the CPU worker pool, if any"""
+        if self._cpu_pool is not None:
+            self._cpu_pool.shutdown()
+            self._cpu_pool = None
+    
+    async def _run_cpu_bound(self, func, *args):
+        """Run a module-level task body in the worker pool, or inline without one"""
+        if self._cpu_pool is None:
+            return func(*args)
+        return await asyncio.get_running_loop().run_in_executor(self._cpu_pool, func, *args)
+    
     def _initialize_agents(self):
         """Initialize specialized MEV agents"""
         self.agents = {
             "arbitrage_detector": Agent(
                 id="arbitrage_detector",
-                capabilities=[TaskType.OPPORTUNITY_DETECTION],
+                capabilities=frozenset({TaskType.OPPORTUNITY_DETECTION}),
                 current_load=0.0,
                 max_capacity=1.0,
                 performance_history={}
             ),
             "sandwich_executor": Agent(
                 id="sandwich_executor", 
-                capabilities=[TaskType.SANDWICH_EXECUTION, TaskType.RISK_ASSESSMENT],
+                capabilities=frozenset({TaskType.SANDWICH_EXECUTION, TaskType.RISK_ASSESSMENT}),
                 current_load=0.0,
                 max_capacity=1.0,
                 performance_history={}
             ),
             "arbitrage_executor": Agent(
                 id="arbitrage_executor",
-                capabilities=[TaskType.ARBITRAGE_EXECUTION, TaskType.BUNDLE_OPTIMIZATION],
+                capabilities=frozenset({TaskType.ARBITRAGE_EXECUTION, TaskType.BUNDLE_OPTIMIZATION}),
                 current_load=0.0,
                 max_capacity=1.0,
                 performance_history={}
             ),
             "risk_manager": Agent(
                 id="risk_manager",
-                capabilities=[TaskType.RISK_ASSESSMENT],
+                capabilities=frozenset({TaskType.RISK_ASSESSMENT}),
                 current_load=0.0,
                 max_capacity=1.0,
                 performance_history={}
             )
         }
+        
+        # Agents able to run each task type, in registration order
+        self._capability_index: Dict[TaskType, List[str]] = defaultdict(list)
+        for agent_id, agent in self.agents.items():
+            for capability in agent.capabilities:
+                self._capability_index[capability].append(agent_id)
     
     async def orchestrate_mev_opportunity(self, opportunity_data: Dict) -> Dict:
         """
@@ -117,121 +249,102 @@ class AdvancedMEVOrchestrator:
     
     def _decompose_mev_opportunity(self, opportunity: Dict) -> List[TaskNode]:
         """Intelligent task decomposition based on opportunity type"""
-        tasks = []
         opportunity_type = opportunity.get('type', 'arbitrage')
         
         if opportunity_type == 'arbitrage':
-            tasks = [
-                TaskNode(
-                    id="risk_assessment_1",
-                    task_type=TaskType.RISK_ASSESSMENT,
-                    dependencies=[],
-                    priority=Priority.CRITICAL,
-                    estimated_complexity=0.1,
-                    required_resources={"cpu": 0.1, "memory": 0.05},
-                    constraints={"max_slippage": 0.005}
-                ),
-                TaskNode(
-                    id="arbitrage_execution_1", 
-                    task_type=TaskType.ARBITRAGE_EXECUTION,
-                    dependencies=["risk_assessment_1"],
-                    priority=Priority.HIGH,
-                    estimated_complexity=0.3,
-                    required_resources={"cpu": 0.3, "memory": 0.2},
-                    constraints={"gas_limit": 500000}
-                ),
-                TaskNode(
-                    id="bundle_optimization_1",
-                    task_type=TaskType.BUNDLE_OPTIMIZATION,
-                    dependencies=["arbitrage_execution_1"],
-                    priority=Priority.HIGH,
-                    estimated_complexity=0.2,
-                    required_resources={"cpu": 0.2, "memory": 0.1},
-                    constraints={"target_profit": opportunity.get('expected_profit', 0)}
-                )
-            ]
-        
+            template = _ARBITRAGE_TEMPLATE
+            overrides = {"bundle_optimization_1": {"target_profit": opportunity.get('expected_profit', 0)}}
         elif opportunity_type == 'sandwich':
-            tasks = [
-                TaskNode(
-                    id="risk_assessment_sandwich",
-                    task_type=TaskType.RISK_ASSESSMENT,
-                    dependencies=[],
-                    priority=Priority.CRITICAL,
-                    estimated_complexity=0.15,
-                    required_resources={"cpu": 0.15, "memory": 0.1},
-                    constraints={"victim_tx": opportunity.get('victim_tx')}
-                ),
-                TaskNode(
-                    id="sandwich_execution_1",
-                    task_type=TaskType.SANDWICH_EXECUTION,
-                    dependencies=["risk_assessment_sandwich"],
-                    priority=Priority.CRITICAL,
-                    estimated_complexity=0.4,
-                    required_resources={"cpu": 0.4, "memory": 0.3},
-                    constraints={"front_run_gas": 150000, "back_run_gas": 100000}
-                )
-            ]
-        
-        return tasks
+            template = _SANDWICH_TEMPLATE
+            overrides = {"risk_assessment_sandwich": {"victim_tx": opportunity.get('victim_tx')}}
+        else:
+            template, overrides = (), {}
+        
+        return [replace(t, constraints={**t.constraints, **overrides.get(t.id, {})}) for t in template]
     
     def _optimize_execution_plan(self, tasks: List[TaskNode]) -> Dict:
         """Advanced execution plan optimization using graph algorithms"""
-        # Build dependency graph
+        # Build dependency graph; the task index travels with the plan so that
+        # concurrent opportunities never share it
+        task_index = {task.id: task for task in tasks}
         dependency_graph = {}
         for task in tasks:
             dependency_graph[task.id] = task.dependencies
         
-        # Topological sort for execution order
-        execution_order = self._topological_sort(dependency_graph)
+        # Topological sort for execution order, with each task's execution level
+        execution_order, task_levels = self._topological_sort(dependency_graph)
         
         # Resource allocation optimization
-        resource_allocation = self._optimize_resource_allocation(tasks, execution_order)
+        resource_allocation = self._optimize_resource_allocation(task_index, execution_order)
         
         # Agent assignment using performance history
         agent_assignments = self._assign_agents_optimally(tasks, resource_allocation)
         
+        # Execution levels and completion estimate in one pass over the order
+        execution_levels, estimated_completion_time = self._group_by_execution_level(task_index, execution_order, task_levels, agent_assignments)
+        
         return {
+            "task_index": task_index,
             "execution_order": execution_order,
             "resource_allocation": resource_allocation,
             "agent_assignments": agent_assignments,
-            "estimated_completion_time": self._estimate_completion_time(tasks, agent_assignments)
+            "execution_levels": execution_levels,
+            "estimated_completion_time": estimated_completion_time
         }
     
     async def _execute_coordinated_plan(self, plan: Dict) -> Dict:
-        """Execute plan with sophisticated coordination"""
+        """Execute plan as a dataflow graph: each task starts once its dependencies finish"""
         results = {}
-        execution_order = plan["execution_order"]
+        task_index = plan["task_index"]
         agent_assignments = plan["agent_assignments"]
         
-        # Group tasks by execution level (parallel execution within levels)
-        execution_levels = self._group_by_execution_level(execution_order)
+        # Outstanding dependencies per task, and reverse edges to release dependents
+        remaining = {}
+        dependents = defaultdict(list)
+        for task_id in plan["execution_order"]:
+            deps = task_index[task_id].dependencies
+            remaining[task_id] = len(deps)
+            for dep in deps:
+                dependents[dep].append(task_id)
         
-        for level, task_ids in execution_levels.items():
-            # Execute all tasks at this level in parallel
-            level_tasks = []
-            for task_id in task_ids:
-                agent_id = agent_assignments[task_id]
-                task = next(t for t in self.task_queue if t.id == task_id)
-                level_tasks.append(self._execute_task_async(task, agent_id))
-            
-            # Wait for all tasks at this level to complete
-            level_results = await asyncio.gather(*level_tasks, return_exceptions=True)
-            
-            # Process results and handle any exceptions
-            for i, result in enumerate(level_results):
-                task_id = task_ids[i]
-                if isinstance(result, Exception):
-                    self.logger.error(f"Task {task_id} failed: {result}")
-                    results[task_id] = {"status": "failed", "error": str(result)}
-                else:
-                    results[task_id] = result
+        running: Dict[asyncio.Task, str] = {}
+        
+        def start(task_id: str):
+            task = task_index[task_id]
+            running[asyncio.create_task(self._execute_task_async(task, agent_assignments[task_id]))] = task_id
+        
+        for task_id, count in remaining.items():
+            if count == 0:
+                start(task_id)
+        
+        try:
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                
+                for future in done:
+                    task_id = running.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        self.logger.error(f"Task {task_id} failed: {error}")
+                        results[task_id] = {"status": "failed", "error": str(error)}
+                    else:
+                        results[task_id] = future.result()
+                    
+                    # Dependents run even after a failure, as with level-by-level execution
+                    for dependent in dependents[task_id]:
+                        remaining[dependent] -= 1
+                        if remaining[dependent] == 0:
+                            start(dependent)
+        finally:
+            for future in running:
+                future.cancel()
         
         return results
     
     async def _execute_task_async(self, task: TaskNode, agent_id: str) -> Dict:
         """Execute individual task with agent specialization"""
         agent = self.agents[agent_id]
+        task_type = task.task_type
         start_time = time.time()
         
         try:
@@ -239,13 +352,13 @@ class AdvancedMEVOrchestrator:
             agent.current_load += task.estimated_complexity
             
             # Simulate task execution based on type
-            if task.task_type == TaskType.RISK_ASSESSMENT:
+            if task_type is TaskType.RISK_ASSESSMENT:
                 result = await self._execute_risk_assessment(task)
-            elif task.task_type == TaskType.ARBITRAGE_EXECUTION:
+            elif task_type is TaskType.ARBITRAGE_EXECUTION:
                 result = await self._execute_arbitrage(task)
-            elif task.task_type == TaskType.SANDWICH_EXECUTION:
+            elif task_type is TaskType.SANDWICH_EXECUTION:
                 result = await self._execute_sandwich(task)
-            elif task.task_type == TaskType.BUNDLE_OPTIMIZATION:
+            elif task_type is TaskType.BUNDLE_OPTIMIZATION:
                 result = await self._execute_bundle_optimization(task)
             else:
                 result = {"status": "unknown_task_type"}
@@ -253,9 +366,8 @@ class AdvancedMEVOrchestrator:
             execution_time = time.time() - start_time
             
             # Update performance history
-            if task.task_type.value not in agent.performance_history:
-                agent.performance_history[task.task_type.value] = []
-            agent.performance_history[task.task_type.value].append(execution_time)
+            total, count = agent.performance_history.get(task_type, (0.0, 0))
+            agent.performance_history[task_type] = (total + execution_time, count + 1)
             
             # Update agent load
             agent.current_load -= task.estimated_complexity
@@ -271,25 +383,19 @@ class AdvancedMEVOrchestrator:
     
     async def _execute_risk_assessment(self, task: TaskNode) -> Dict:
         """Advanced risk assessment with ML-based scoring"""
-        await asyncio.sleep(0.1)  # Simulate computation
+        if self._simulate:
+            await asyncio.sleep(0.1)  # Simulate computation
         
-        risk_score = 0.15  # Simulated risk calculation
-        max_slippage = task.constraints.get("max_slippage", 0.01)
-        
-        return {
-            "status": "completed",
-            "risk_score": risk_score,
-            "recommendation": "proceed" if risk_score < max_slippage else "abort",
-            "confidence": 0.95
-        }
+        return await self._run_cpu_bound(_assess_risk, task.constraints)
     
     async def _execute_arbitrage(self, task: TaskNode) -> Dict:
         """Execute arbitrage with optimal routing"""
-        await asyncio.sleep(0.3)  # Simulate execution time
+        if self._simulate:
+            await asyncio.sleep(0.3)  # Simulate execution time
         
         return {
             "status": "completed",
-            "transaction_hash": f"0x{''.join(['a'] * 64)}",  # Simulated tx hash
+            "transaction_hash": _DUMMY_TX_A,
             "gas_used": 350000,
             "profit_realized": 0.025,  # ETH
             "execution_price": 1850.75
@@ -297,164 +403,147 @@ class AdvancedMEVOrchestrator:
     
     async def _execute_sandwich(self, task: TaskNode) -> Dict:
         """Execute sandwich attack with precise timing"""
-        await asyncio.sleep(0.4)  # Simulate execution time
+        if self._simulate:
+            await asyncio.sleep(0.4)  # Simulate execution time
         
         return {
             "status": "completed", 
-            "front_run_tx": f"0x{''.join(['b'] * 64)}",
-            "back_run_tx": f"0x{''.join(['c'] * 64)}",
+            "front_run_tx": _DUMMY_TX_B,
+            "back_run_tx": _DUMMY_TX_C,
             "profit_realized": 0.032,  # ETH
             "victim_slippage": 0.003
         }
     
     async def _execute_bundle_optimization(self, task: TaskNode) -> Dict:
         """Optimize transaction bundle for maximum MEV extraction"""
-        await asyncio.sleep(0.2)  # Simulate optimization time
+        if self._simulate:
+            await asyncio.sleep(0.2)  # Simulate optimization time
         
-        return {
-            "status": "completed",
-            "optimized_gas_price": 25,  # gwei
-            "bundle_hash": f"0x{''.join(['d'] * 64)}",
-            "expected_profit": 0.028,  # ETH
-            "optimization_ratio": 1.15
-        }
+        return await self._run_cpu_bound(_optimize_bundle, task.constraints)
     
-    def _topological_sort(self, graph: Dict[str, List[str]]) -> List[str]:
-        """Topological sort for task ordering"""
-        in_degree = {node: 0 for node in graph}
-        for node in graph:
-            for neighbor in graph[node]:
-                if neighbor in in_degree:
-                    in_degree[neighbor] += 1
+    def _topological_sort(self, graph: Dict[str, List[str]]) -> Tuple[List[str], Dict[str, int]]:
+        """Topological sort for task ordering (dependencies before dependents)
         
-        queue = [node for node in in_degree if in_degree[node] == 0]
+        Also returns each task's execution level: 0 without dependencies,
+        otherwise one more than its deepest dependency.
+        """
+        # graph maps each task to its dependencies; walk the reverse edges
+        in_degree = {node: 0 for node in graph}
+        dependents = {node: [] for node in graph}
+        for node, deps in graph.items():
+            for dep in deps:
+                if dep not in dependents:
+                    raise ValueError(f"Task {node} depends on unknown task {dep}")
+                dependents[dep].append(node)
+            in_degree[node] = len(deps)
+        
+        queue = deque(node for node, degree in in_degree.items() if degree == 0)
         result = []
+        levels = dict.fromkeys(graph, 0)
         
         while queue:
-            node = queue.pop(0)
+            node = queue.popleft()
             result.append(node)
+            next_level = levels[node] + 1
             
-            for neighbor in graph.get(node, []):
-                if neighbor in in_degree:
-                    in_degree[neighbor] -= 1
-                    if in_degree[neighbor] == 0:
-                        queue.append(neighbor)
-        
-        return result
+            for neighbor in dependents[node]:
+                if next_level > levels[neighbor]:
+                    levels[neighbor] = next_level
+                in_degree[neighbor] -= 1
+                if in_degree[neighbor] == 0:
+                    queue.append(neighbor)
+        
+        return result, levels
     
-    def _optimize_resource_allocation(self, tasks: List[TaskNode], order: List[str]) -> Dict:
+    def _optimize_resource_allocation(self, task_index: Dict[str, TaskNode], order: List[str]) -> ResourceAllocation:
         """Optimize resource allocation using advanced algorithms"""
-        allocation = {}
-        for task_id in order:
-            task = next(t for t in tasks if t.id == task_id)
-            allocation[task_id] = {
-                "cpu": task.required_resources.get("cpu", 0.1),
-                "memory": task.required_resources.get("memory", 0.1),
-                "priority_weight": 1.0 / task.priority.value
-            }
-        return allocation
+        ordered = [task_index[task_id] for task_id in order]
+        n = len(ordered)
+        priorities = np.fromiter((t.priority.value for t in ordered), dtype=np.float64, count=n)
+        
+        return ResourceAllocation(
+            index={task_id: i for i, task_id in enumerate(order)},
+            cpu=np.fromiter((t.required_resources.get("cpu", 0.1) for t in ordered), dtype=np.float64, count=n),
+            memory=np.fromiter((t.required_resources.get("memory", 0.1) for t in ordered), dtype=np.float64, count=n),
+            priority_weight=1.0 / priorities
+        )
     
-    def _assign_agents_optimally(self, tasks: List[TaskNode], allocation: Dict) -> Dict:
+    def _assign_agents_optimally(self, tasks: List[TaskNode], allocation: ResourceAllocation) -> Dict:
         """Optimal agent assignment using performance history"""
         assignments = {}
         
         for task in tasks:
             best_agent = None
             best_score = float('inf')
+            task_type = task.task_type
             
-            for agent_id, agent in self.agents.items():
-                if task.task_type in agent.capabilities:
-                    # Calculate assignment score based on current load and performance
-                    load_factor = agent.current_load / agent.max_capacity
-                    
-                    # Get average performance for this task type
-                    performance_history = agent.performance_history.get(task.task_type.value, [1.0])
-                    avg_performance = sum(performance_history) / len(performance_history)
-                    
-                    # Combined score (lower is better)
-                    score = load_factor * 0.6 + avg_performance * 0.4
-                    
-                    if score < best_score:
-                        best_score = score
-                        best_agent = agent_id
+            for agent_id in self._capability_index.get(task_type, ()):
+                agent = self.agents[agent_id]
+                
+                # Calculate assignment score based on current load and performance
+                load_factor = agent.current_load / agent.max_capacity
+                
+                # Get average performance for this task type
+                total, count = agent.performance_history.get(task_type, (1.0, 1))
+                avg_performance = total / count
+                
+                # Combined score (lower is better)
+                score = load_factor * 0.6 + avg_performance * 0.4
+                
+                if score < best_score:
+                    best_score = score
+                    best_agent = agent_id
             
             assignments[task.id] = best_agent
         
         return assignments
     
-    def _group_by_execution_level(self, order: List[str]) -> Dict[int, List[str]]:
-        """Group tasks by execution level for parallel processing"""
-        levels = {}
-        task_levels = {}
+    def _group_by_execution_level(self, task_index: Dict[str, TaskNode], order: List[str], task_levels: Dict[str, int],
+                                  assignments: Dict) -> Tuple[List[List[str]], float]:
+        """Group tasks by execution level and estimate completion time in one pass
         
-        # Calculate execution level for each task
-        for task_id in order:
-            task = next(t for t in self.task_queue if t.id == task_id)
-            if not task.dependencies:
-                task_levels[task_id] = 0
-            else:
-                max_dep_level = max(task_levels.get(dep, 0) for dep in task.dependencies if dep in task_levels)
-                task_levels[task_id] = max_dep_level + 1
+        levels[i] holds the ids of the tasks at depth i, in topological order.
+        """
+        depth = max(task_levels.values(), default=-1) + 1
+        levels = [[] for _ in range(depth)]
+        level_times = [0.0] * depth
         
-        # Group by level
-        for task_id, level in task_levels.items():
-            if level not in levels:
-                levels[level] = []
+        for task_id in order:
+            task = task_index[task_id]
+            level = task_levels[task_id]
             levels[level].append(task_id)
-        
-        return levels
-    
-    def _estimate_completion_time(self, tasks: List[TaskNode], assignments: Dict) -> float:
-        """Estimate total completion time considering parallel execution"""
-        level_times = {}
-        
-        for task in tasks:
-            agent_id = assignments[task.id]
-            agent = self.agents[agent_id]
-            
-            # Get estimated execution time based on performance history
-            history = agent.performance_history.get(task.task_type.value, [task.estimated_complexity])
-            estimated_time = sum(history) / len(history)
             
-            # Find task level
-            task_level = self._get_task_level(task, tasks)
-            
-            if task_level not in level_times:
-                level_times[task_level] = 0
-            level_times[task_level] = max(level_times[task_level], estimated_time)
+            # Estimated execution time based on the assigned agent's history;
+            # levels run in parallel internally, so each costs its slowest task
+            agent = self.agents[assignments[task_id]]
+            total, count = agent.performance_history.get(task.task_type, (task.estimated_complexity, 1))
+            level_times[level] = max(level_times[level], total / count)
         
-        return sum(level_times.values())
-    
-    def _get_task_level(self, target_task: TaskNode, all_tasks: List[TaskNode]) -> int:
-        """Get execution level of a task"""
-        if not target_task.dependencies:
-            return 0
-        
-        max_dep_level = 0
-        for dep_id in target_task.dependencies:
-            dep_task = next(t for t in all_tasks if t.id == dep_id)
-            dep_level = self._get_task_level(dep_task, all_tasks)
-            max_dep_level = max(max_dep_level, dep_level)
-        
-        return max_dep_level + 1
+        return levels, sum(level_times)
     
     def _aggregate_results(self, results: Dict) -> Dict:
         """Aggregate task results into final MEV execution result"""
-        total_profit = 0
+        total_profit = 0.0
         total_gas_used = 0
         transaction_hashes = []
+        add_hash = transaction_hashes.append
         
-        for task_id, result in results.items():
-            if result.get("status") == "completed":
-                total_profit += result.get("profit_realized", 0)
-                total_gas_used += result.get("gas_used", 0)
-                
-                if "transaction_hash" in result:
-                    transaction_hashes.append(result["transaction_hash"])
-                if "front_run_tx" in result:
-                    transaction_hashes.append(result["front_run_tx"])
-                if "back_run_tx" in result:
-                    transaction_hashes.append(result["back_run_tx"])
+        for result in results.values():
+            if result.get("status") != "completed":
+                continue
+            
+            total_profit += result.get("profit_realized", 0.0)
+            total_gas_used += result.get("gas_used", 0)
+            
+            tx_hash = result.get("transaction_hash")
+            if tx_hash:
+                add_hash(tx_hash)
+            front_run = result.get("front_run_tx")
+            if front_run:
+                add_hash(front_run)
+            back_run = result.get("back_run_tx")
+            if back_run:
+                add_hash(back_run)
         
         return {
             "status": "completed",
@@ -466,7 +555,7 @@ class AdvancedMEVOrchestrator:
 
 # Example usage and testing
 async def main():
-    orchestrator = AdvancedMEVOrchestrator()
+    orchestrator = AdvancedMEVOrchestrator(simulate=True)
     
     # Test arbitrage opportunity
     arbitrage_opportunity = {
@@ -477,7 +566,7 @@ async def main():
     }
     
     result = await orchestrator.orchestrate_mev_opportunity(arbitrage_opportunity)
-    print(f"Arbitrage Result: {json.dumps(result, indent=2)}")
+    print(f"Arbitrage Result: {_format_result(result)}")
     
     # Test sandwich opportunity
     sandwich_opportunity = {
@@ -487,7 +576,9 @@ async def main():
     }
     
     result = await orchestrator.orchestrate_mev_opportunity(sandwich_opportunity)
-    print(f"Sandwich Result: {json.dumps(result, indent=2)}")
+    print(f"Sandwich Result: {_format_result(result)}")
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main())
\ No newline at end of file
@@ -14,6 +14,11 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional
 import logging
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -172,7 +177,7 @@ class FailoverManager:
         """Load failover configuration"""
         try:
             with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_YamlLoader)
                 
             cb_config = CircuitBreakerConfig(**config['circuit_breaker'])
             
@@ -6,12 +6,9 @@ Implements comprehensive sync status monitoring with learning capabilities
 """
 
 import json
-import sys
-import time
 import subprocess
 from dataclasses import dataclass
 from typing import Dict, Any, Optional
-import os
 from datetime import datetime
 
 @dataclass
@@ -40,6 +37,10 @@ class NodeInfo:
         if self.endpoints is None:
             self.endpoints = {}
 
+def _hex_to_int(value: Optional[str]) -> int:
+    """Decode a JSON-RPC hex quantity such as '0x1b4'; missing values count as 0"""
+    return int(value, 16) if value else 0
+
 class BlockchainSyncVerifier:
     """Professional blockchain sync verification system"""
 
@@ -81,7 +82,6 @@ class BlockchainSyncVerifier:
         # Calculate system-wide metrics
         total_nodes = len(self.nodes)
         running_nodes = sum(1 for n in self.nodes.values() if n.status == 'running')
-        total_sync_progress = sum(n.sync_progress for n in self.nodes.values() if n.sync_progress is not None) / total_nodes
         rpc_available = sum(1 for n in self.nodes.values() if n.rpc_responsive)
 
         self.results['total_nodes'] = total_nodes
@@ -118,12 +118,12 @@ class BlockchainSyncVerifier:
         # Service status check
         try:
             result = subprocess.run(
-                ['systemctl', 'is-active', node['service']],
+                ['systemctl', 'is-active', node.service],
                 capture_output=True, text=True, timeout=10
             )
             if result.returncode == 0:
                 node.status = 'running'
-                node.uptime_hours = self._get_uptime_hours(node['service'])
+                node.uptime_hours = self._get_uptime_hours(node.service)
             elif result.returncode == 3:
                 node.status = 'stopped'
             else:
@@ -148,13 +148,12 @@ class BlockchainSyncVerifier:
                 try:
                     data = json.loads(result.stdout)
                     sync_data = data.get('result', {})
-                    if sync_data == False:
+                    if sync_data is False:
+                        # eth_syncing returns a bare false once synced; there are no block fields to read
                         node.sync_progress = 100.0
-                        node.current_block = int(data.get('result', {}).get('currentBlock', '0x0'), 16)
-                        node.highest_block = int(data.get('result', {}).get('highestBlock', '0x0'), 16)
                     else:
-                        node.current_block = int(sync_data.get('currentBlock', '0x0'), 16)
-                        node.highest_block = int(sync_data.get('highestBlock', '0x0'), 16)
+                        node.current_block = _hex_to_int(sync_data.get('currentBlock'))
+                        node.highest_block = _hex_to_int(sync_data.get('highestBlock'))
                         node.sync_progress = (node.current_block / node.highest_block * 100) if node.highest_block > 0 else 100.0
                 except Exception:
                     node.rpc_responsive = True
@@ -172,12 +171,19 @@ class BlockchainSyncVerifier:
         p2p_port = node_config.get('p2p_port')
         if p2p_port:
             try:
-                peer_cmd = [
-                    'netstat', '-tlnp', '|', 'grep', str(p2p_port), '|', 'wc', '-l'
-                ]
-                result = subprocess.run(peer_cmd, capture_output=True, text=True, timeout=10)
-                node.peers = int(result.stdout.strip()) if result.returncode == 0 else 0
-            except Exception as e:
+                # Count established TCP connections on the P2P port; filtering here
+                # replaces a shell pipeline that subprocess never ran as one
+                result = subprocess.run(['netstat', '-tn'], capture_output=True, text=True, timeout=10)
+                if result.returncode == 0:
+                    # Inbound peers hit our port locally (column 3), outbound ones remotely (column 4)
+                    suffix = f":{p2p_port}"
+                    node.peers = 0
+                    for line in result.stdout.splitlines():
+                        if 'ESTABLISHED' in line:
+                            parts = line.split()
+                            if parts[3].endswith(suffix) or parts[4].endswith(suffix):
+                                node.peers += 1
+            except Exception:
                 node.peers = 0
 
         # Resource usage
@@ -277,15 +283,6 @@ class BlockchainSyncVerifier:
 
         return sum(health_scores) / len(health_scores) if health_scores else 0.0
 
-    def _format_block_number(self, block_number: str) -> str:
-        """Format block number with proper padding"""
-        if not block_number or block_number == '0':
-            return '0x0'
-        try:
-            return f"0x{int(block_number, 16):x}"
-        except:
-            return block_number
-
     def print_summary(self):
         """Print comprehensive verification summary"""
         print(f"\n🏛️ BLOCKCHAIN NODE ADMINISTRATION OVERVIEW")
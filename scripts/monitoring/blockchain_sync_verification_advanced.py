@@ -17,10 +17,13 @@ import sys
 import time
 import subprocess
 import requests
+from requests.adapters import HTTPAdapter
 import logging
 import argparse
 import yaml
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from typing import Dict, Any, Optional, List, Tuple
@@ -32,7 +35,52 @@ import signal
 import socket
 import psutil
 
-@dataclass
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Sync state, head block and peer count, fetched in a single JSON-RPC batch
+_SYNC_BATCH_METHODS = ("eth_syncing", "eth_blockNumber", "net_peerCount")
+_SYNC_BATCH = [
+    {"jsonrpc": "2.0", "method": method, "params": [], "id": i}
+    for i, method in enumerate(_SYNC_BATCH_METHODS)
+]
+# Encoded once; every node is polled with the same body
+_SYNC_BATCH_BODY = json.dumps(_SYNC_BATCH, separators=(',', ':')).encode()
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Recent batch results per RPC URL, so repeated checks within a poll cycle hit the node once
+_SYNC_CACHE_TTL = 2.0
+_SYNC_CACHE: Dict[str, Tuple[float, "SyncSnapshot"]] = {}
+
+# Upper bound on nodes probed at once, and retries for transient RPC failures
+_MAX_VERIFY_WORKERS = 8
+_RPC_ATTEMPTS = 3
+_RPC_BACKOFF = 0.1
+
+# web3_clientVersion is re-read this often so an upgrade shows up without a restart
+_CLIENT_VERSION_TTL = 300.0
+
+# How long a systemctl is-active answer is reused
+_SERVICE_STATUS_TTL = 5.0
+
+@lru_cache(maxsize=4)
+def _load_config_file(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a config file; keyed on mtime so an edited file is re-read.
+    The returned dict is shared between callers and must not be mutated."""
+    if path.endswith('.json'):
+        with open(path, 'rb') as f:
+            return json.load(f) or {}
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+@dataclass(slots=True)
 class NodeInfo:
     """Comprehensive node information structure"""
     name: str
@@ -65,6 +113,30 @@ class NodeInfo:
         if self.endpoints is None:
             self.endpoints = {}
 
+@dataclass(frozen=True, slots=True)
+class SyncSnapshot:
+    """Decoded reply to the eth_syncing / eth_blockNumber / net_peerCount batch"""
+    syncing: Optional[bool] = None  # None when eth_syncing gave no usable answer
+    current_block: Optional[int] = None
+    highest_block: Optional[int] = None
+    peers: Optional[int] = None
+
+    @classmethod
+    def from_replies(cls, replies: List[Dict[str, Any]]) -> "SyncSnapshot":
+        results = {reply.get('id'): reply.get('result') for reply in replies}
+        sync_data = results.get(0)
+        peer_count = results.get(2)
+        peers = int(peer_count, 16) if peer_count else None
+
+        if sync_data is False:
+            return cls(False, int(results.get(1) or '0x0', 16), None, peers)
+        if isinstance(sync_data, dict):
+            return cls(True,
+                       int(sync_data.get('currentBlock', '0x0'), 16),
+                       int(sync_data.get('highestBlock', '0x0'), 16),
+                       peers)
+        return cls(peers=peers)
+
 @dataclass
 class AlertConfig:
     """Alert configuration settings"""
@@ -95,6 +167,20 @@ class BlockchainSyncVerifier:
         self.peers_threshold = 25
         self.sync_threshold = 90.0
         self.monitoring = False
+
+        # One pooled session for all RPC and webhook calls, so repeated
+        # requests to the same node reuse keep-alive connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Client version per RPC URL as (fetched_at, version); it only changes on upgrade
+        self._client_versions: Dict[str, Tuple[float, str]] = {}
+        # Client process per client name, revalidated each tick instead of rescanned
+        self._processes: Dict[str, psutil.Process] = {}
+        # systemd state per unit as (checked_at, status), to skip a fork/exec per tick
+        self._service_status: Dict[str, Tuple[float, str]] = {}
         self.alert_cooldowns = {}
         self.db_path = "/var/lib/blockchain/sync_verification.db"
 
@@ -178,12 +264,11 @@ class BlockchainSyncVerifier:
         config_path = Path(self.config_file)
         if config_path.exists():
             try:
-                with open(config_path, 'r') as f:
-                    config = yaml.safe_load(f)
-                    if 'alerts' in config:
-                        for key, value in config['alerts'].items():
-                            if hasattr(self.alert_config, key):
-                                setattr(self.alert_config, key, value)
+                config = _load_config_file(str(config_path), config_path.stat().st_mtime)
+                if 'alerts' in config:
+                    for key, value in config['alerts'].items():
+                        if hasattr(self.alert_config, key):
+                            setattr(self.alert_config, key, value)
             except Exception as e:
                 self.logger.warning(f"Failed to load config: {e}")
 
@@ -194,9 +279,12 @@ class BlockchainSyncVerifier:
 
         nodes_to_check = self.get_node_configurations(node_type, network)
 
-        for node_config in nodes_to_check:
-            node_info = self.verify_single_node(node_config, verification_level)
-            self.nodes[node_info.name] = node_info
+        # Probe nodes concurrently; each check mostly waits on systemctl,
+        # RPC round-trips and sockets, so wall time is the slowest node
+        verify = partial(self.verify_single_node, verification_level=verification_level)
+        with ThreadPoolExecutor(max_workers=max(1, min(_MAX_VERIFY_WORKERS, len(nodes_to_check)))) as pool:
+            for node_info in pool.map(verify, nodes_to_check):
+                self.nodes[node_info.name] = node_info
 
         # Calculate system-wide metrics
         self.calculate_system_metrics()
@@ -272,7 +360,6 @@ class BlockchainSyncVerifier:
 
         if node.rpc_responsive:
             self.get_sync_status(node, rpc_url)
-            self.get_peer_count(node, rpc_url)
 
         # Resource usage monitoring
         if node.status == 'running':
@@ -297,27 +384,35 @@ class BlockchainSyncVerifier:
         return node
 
     def check_service_status(self, service_name: str) -> str:
-        """Check systemd service status"""
+        """Check systemd service status, reusing an answer younger than _SERVICE_STATUS_TTL"""
+        now = time.monotonic()
+        checked_at, status = self._service_status.get(service_name, (0.0, None))
+        if status is not None and now - checked_at < _SERVICE_STATUS_TTL:
+            return status
+
         try:
             result = subprocess.run(
                 ['systemctl', 'is-active', service_name],
                 capture_output=True, text=True, timeout=10
             )
             if result.returncode == 0:
-                return 'running'
+                status = 'running'
             elif result.returncode == 3:
-                return 'stopped'
+                status = 'stopped'
             else:
-                return 'unknown'
+                status = 'unknown'
         except Exception as e:
             self.logger.error(f"Service check failed for {service_name}: {e}")
             return 'error'
 
+        self._service_status[service_name] = (now, status)
+        return status
+
     def check_rpc_connectivity(self, rpc_url: str) -> Tuple[bool, float]:
         """Check RPC endpoint connectivity with response time"""
         try:
             start_time = time.time()
-            response = requests.post(
+            response = self.session.post(
                 rpc_url,
                 json={"jsonrpc":"2.0","method":"eth_syncing","params":[],"id":1},
                 timeout=self.rpc_timeout
@@ -331,37 +426,53 @@ class BlockchainSyncVerifier:
         except Exception:
             return False, 0.0
 
+    def _fetch_sync_batch(self, rpc_url: str) -> Optional[SyncSnapshot]:
+        """Return the decoded sync batch, reusing a reply younger than _SYNC_CACHE_TTL"""
+        now = time.monotonic()
+        cached_at, snapshot = _SYNC_CACHE.get(rpc_url, (0.0, None))
+        if snapshot is not None and now - cached_at < _SYNC_CACHE_TTL:
+            return snapshot
+
+        # Retry failed connects with exponential backoff; a node that is restarting
+        # or has a full accept queue usually answers on the next try. Read timeouts
+        # are not retried, since a node that is slow to answer would just stall again
+        for attempt in range(_RPC_ATTEMPTS):
+            try:
+                response = self.session.post(rpc_url, data=_SYNC_BATCH_BODY, headers=_JSON_HEADERS, timeout=10)
+                break
+            except requests.ConnectionError:
+                if attempt == _RPC_ATTEMPTS - 1:
+                    raise
+                time.sleep(_RPC_BACKOFF * 2 ** attempt)
+
+        if response.status_code != 200:
+            return None
+
+        replies = _json_loads(response.content)
+        if not isinstance(replies, list):
+            raise ValueError(f"Expected a JSON-RPC batch reply, got {type(replies).__name__}")
+        snapshot = SyncSnapshot.from_replies(replies)
+        _SYNC_CACHE[rpc_url] = (now, snapshot)
+        return snapshot
+
     def get_sync_status(self, node: NodeInfo, rpc_url: str):
-        """Get detailed sync status from RPC"""
+        """Get sync status, head block and peer count from one batched RPC"""
         try:
-            # Get sync status
-            response = requests.post(
-                rpc_url,
-                json={"jsonrpc":"2.0","method":"eth_syncing","params":[],"id":1},
-                timeout=10
-            )
+            snapshot = self._fetch_sync_batch(rpc_url)
 
-            if response.status_code == 200:
-                data = response.json()
-                sync_data = data.get('result', {})
-
-                if sync_data == False:
+            if snapshot is not None:
+                if snapshot.syncing is False:
                     node.sync_progress = 100.0
-                    # Get current block number
-                    block_response = requests.post(
-                        rpc_url,
-                        json={"jsonrpc":"2.0","method":"eth_blockNumber","params":[],"id":2},
-                        timeout=10
-                    )
-                    if block_response.status_code == 200:
-                        block_data = block_response.json()
-                        node.current_block = int(block_data.get('result', '0x0'), 16)
-                else:
-                    node.current_block = int(sync_data.get('currentBlock', '0x0'), 16)
-                    node.highest_block = int(sync_data.get('highestBlock', '0x0'), 16)
+                    node.current_block = snapshot.current_block
+                elif snapshot.syncing:
+                    node.current_block = snapshot.current_block
+                    node.highest_block = snapshot.highest_block
                     if node.highest_block > 0:
                         node.sync_progress = (node.current_block / node.highest_block) * 100
 
+                if snapshot.peers is not None:
+                    node.peers = snapshot.peers
+
                 # Get last block time
                 if node.current_block:
                     node.last_block_time = self.get_block_timestamp(rpc_url, node.current_block)
@@ -370,48 +481,46 @@ class BlockchainSyncVerifier:
             self.logger.error(f"Failed to get sync status for {node.name}: {e}")
             node.error = str(e)
 
-    def get_peer_count(self, node: NodeInfo, rpc_url: str):
-        """Get peer count from RPC"""
-        try:
-            response = requests.post(
-                rpc_url,
-                json={"jsonrpc":"2.0","method":"net_peerCount","params":[],"id":3},
-                timeout=10
-            )
+    def _find_process(self, client: str) -> Optional[psutil.Process]:
+        """Return the client's process, rescanning the process table only when the cached one exited"""
+        proc = self._processes.get(client)
+        if proc is not None and proc.is_running():
+            return proc
 
-            if response.status_code == 200:
-                data = response.json()
-                node.peers = int(data.get('result', '0x0'), 16)
-        except Exception as e:
-            self.logger.error(f"Failed to get peer count for {node.name}: {e}")
+        needle = client.lower()
+        for proc in psutil.process_iter(['name']):
+            name = proc.info['name']
+            if name and needle in name.lower():
+                self._processes[client] = proc
+                return proc
+
+        self._processes.pop(client, None)
+        return None
 
     def get_resource_usage(self, node: NodeInfo):
         """Get comprehensive resource usage"""
         try:
-            # Find process
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_info']):
-                try:
-                    if node.client.lower() in proc.info['name'].lower():
-                        # Memory usage
-                        if proc.info['memory_info']:
-                            node.memory_mb = proc.info['memory_info'].rss / 1024 / 1024
-
-                        # CPU usage
-                        node.cpu_usage_percent = proc.info['cpu_percent']
-
-                        # Disk I/O
-                        io_counters = proc.io_counters()
-                        if io_counters:
-                            node.disk_usage_gb = (io_counters.read_bytes + io_counters.write_bytes) / 1024 / 1024 / 1024
-
-                        # Network I/O
-                        net_counters = proc.io_counters()
-                        if net_counters:
-                            node.network_rx_mb = net_counters.read_bytes / 1024 / 1024
-                            node.network_tx_mb = net_counters.write_bytes / 1024 / 1024
-                        break
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
+            proc = self._find_process(node.client)
+            if proc is None:
+                return
+
+            try:
+                with proc.oneshot():
+                    # Memory usage
+                    node.memory_mb = proc.memory_info().rss / 1024 / 1024
+
+                    # CPU usage since the previous check; the cached Process keeps
+                    # the baseline, so only the very first reading is 0.0
+                    node.cpu_usage_percent = proc.cpu_percent(interval=None)
+
+                    # Disk and network I/O both come from one io_counters read
+                    io_counters = proc.io_counters()
+                    if io_counters:
+                        node.disk_usage_gb = (io_counters.read_bytes + io_counters.write_bytes) / 1024 / 1024 / 1024
+                        node.network_rx_mb = io_counters.read_bytes / 1024 / 1024
+                        node.network_tx_mb = io_counters.write_bytes / 1024 / 1024
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                self._processes.pop(node.client, None)
         except Exception as e:
             self.logger.error(f"Failed to get resource usage for {node.name}: {e}")
 
@@ -444,15 +553,7 @@ class BlockchainSyncVerifier:
         try:
             # Check client version
             rpc_url = f"http://127.0.0.1:{node_config['rpc_port']}"
-            version_response = requests.post(
-                rpc_url,
-                json={"jsonrpc":"2.0","method":"web3_clientVersion","params":[],"id":4},
-                timeout=10
-            )
-
-            if version_response.status_code == 200:
-                version_data = version_response.json()
-                node.version = version_data.get('result', 'unknown')
+            node.version = self.get_client_version(rpc_url) or node.version
 
             # Calculate sync speed
             if node.current_block and node.highest_block:
@@ -461,6 +562,25 @@ class BlockchainSyncVerifier:
         except Exception as e:
             self.logger.error(f"Comprehensive checks failed for {node.name}: {e}")
 
+    def get_client_version(self, rpc_url: str) -> Optional[str]:
+        """Get web3_clientVersion, reusing the last answer for _CLIENT_VERSION_TTL"""
+        now = time.monotonic()
+        fetched_at, version = self._client_versions.get(rpc_url, (0.0, None))
+        if version is not None and now - fetched_at < _CLIENT_VERSION_TTL:
+            return version
+
+        response = self.session.post(
+            rpc_url,
+            json={"jsonrpc":"2.0","method":"web3_clientVersion","params":[],"id":4},
+            timeout=10
+        )
+        if response.status_code != 200:
+            return None
+
+        version = _json_loads(response.content).get('result', 'unknown')
+        self._client_versions[rpc_url] = (now, version)
+        return version
+
     def calculate_sync_speed(self, node: NodeInfo, rpc_url: str) -> float:
         """Calculate sync speed in blocks per hour"""
         try:
@@ -471,14 +591,14 @@ class BlockchainSyncVerifier:
             time.sleep(30)
 
             # Get new block
-            response = requests.post(
+            response = self.session.post(
                 rpc_url,
                 json={"jsonrpc":"2.0","method":"eth_blockNumber","params":[],"id":5},
                 timeout=10
             )
 
             if response.status_code == 200:
-                new_block = int(response.json().get('result', '0x0'), 16)
+                new_block = int(_json_loads(response.content).get('result', '0x0'), 16)
                 blocks_diff = new_block - current_block
                 return (blocks_diff / 30) * 3600  # Convert to blocks per hour
         except Exception:
@@ -487,34 +607,18 @@ class BlockchainSyncVerifier:
 
     def calculate_node_health_score(self, node: NodeInfo) -> float:
         """Calculate comprehensive health score for individual node"""
-        score = 0.0
-
-        # Service availability (25%)
-        if node.status == 'running':
-            score += 25.0
-
-        # RPC responsiveness (25%)
-        if node.rpc_responsive:
-            score += 25.0
+        # Service availability (25%) and RPC responsiveness (25%)
+        score = 25.0 * (node.status == 'running') + 25.0 * node.rpc_responsive
 
-        # Sync progress (30%)
+        # Sync progress (30%); 99.5% and up counts as fully synced
         if node.sync_progress is not None:
-            if node.sync_progress >= 99.5:
-                score += 30.0
-            else:
-                score += (node.sync_progress / 100) * 30
+            score += 30.0 if node.sync_progress >= 99.5 else node.sync_progress * 0.3
 
-        # Peer connectivity (10%)
-        if node.peers >= self.peers_threshold:
-            score += 10.0
-        else:
-            score += (node.peers / self.peers_threshold) * 10.0
+        # Peer connectivity (10%), capped at the threshold
+        score += min(node.peers, self.peers_threshold) * 10.0 / self.peers_threshold
 
-        # Resource efficiency (10%)
-        if node.memory_mb > 0 and node.memory_mb < 16000:  # Under 16GB is good
-            score += 5.0
-        if node.cpu_usage_percent > 0 and node.cpu_usage_percent < 80:  # Under 80% is good
-            score += 5.0
+        # Resource efficiency (10%): under 16GB memory and under 80% CPU are good
+        score += 5.0 * (0 < node.memory_mb < 16000) + 5.0 * (0 < node.cpu_usage_percent < 80)
 
         return min(100.0, score)
 
@@ -551,7 +655,7 @@ class BlockchainSyncVerifier:
     def get_block_timestamp(self, rpc_url: str, block_number: int) -> Optional[datetime]:
         """Get timestamp for a specific block"""
         try:
-            response = requests.post(
+            response = self.session.post(
                 rpc_url,
                 json={
                     "jsonrpc":"2.0",
@@ -563,7 +667,7 @@ class BlockchainSyncVerifier:
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 block_data = data.get('result', {})
                 timestamp_hex = block_data.get('timestamp', '0x0')
                 timestamp = int(timestamp_hex, 16)
@@ -902,7 +1006,7 @@ class BlockchainSyncVerifier:
                 }]
             }
 
-            response = requests.post(self.alert_config.slack_webhook_url, json=payload, timeout=10)
+            response = self.session.post(self.alert_config.slack_webhook_url, json=payload, timeout=10)
             if response.status_code == 200:
                 self.logger.info("Slack notification sent successfully")
         except Exception as e:
@@ -925,7 +1029,7 @@ class BlockchainSyncVerifier:
                 }]
             }
 
-            response = requests.post(self.alert_config.discord_webhook_url, json=payload, timeout=10)
+            response = self.session.post(self.alert_config.discord_webhook_url, json=payload, timeout=10)
             if response.status_code == 204:
                 self.logger.info("Discord notification sent successfully")
         except Exception as e:
@@ -1039,10 +1143,12 @@ class BlockchainSyncVerifier:
             status_icon = '🟢' if node.status == 'running' else '🔴'
             health_icon = '✅' if node.health_score >= 80 else '⚠️' if node.health_score >= 60 else '❌'
 
-            print(f"   {status_icon} {node_name.upper()} {health_icon}")
-            print(f"      Client: {node.client.upper()}")
-            print(f"      Status: {node.status.upper()}")
-            print(f"      Health: {node.health_score:.1f}%")
+            lines = [
+                f"   {status_icon} {node_name.upper()} {health_icon}",
+                f"      Client: {node.client.upper()}",
+                f"      Status: {node.status.upper()}",
+                f"      Health: {node.health_score:.1f}%",
+            ]
 
             if node.sync_progress is not None:
                 if node.sync_progress >= 100:
@@ -1051,44 +1157,51 @@ class BlockchainSyncVerifier:
                     sync_status = f'SYNCING ({node.sync_progress:.1f}%)'
                 else:
                     sync_status = f'SYNCING ({node.sync_progress:.1f}%)'
-                print(f"      Sync: {sync_status}")
+                lines.append(f"      Sync: {sync_status}")
 
             if node.current_block:
-                print(f"      Block: {node.current_block:,}")
+                lines.append(f"      Block: {node.current_block:,}")
 
             rpc_status = "✅" if node.rpc_responsive else "❌"
-            print(f"      RPC: {rpc_status} ({node.response_time_ms:.0f}ms)")
-            print(f"      Peers: {node.peers}")
-            print(f"      Memory: {node.memory_mb/1024:.1f}GB")
-            print(f"      CPU: {node.cpu_usage_percent:.1f}%")
+            lines.append(f"      RPC: {rpc_status} ({node.response_time_ms:.0f}ms)")
+            lines.append(f"      Peers: {node.peers}")
+            lines.append(f"      Memory: {node.memory_mb/1024:.1f}GB")
+            lines.append(f"      CPU: {node.cpu_usage_percent:.1f}%")
 
             if node.issues:
-                print(f"      Issues: {len(node.issues)}")
-                for issue in node.issues[:3]:  # Show first 3 issues
-                    print(f"         • {issue}")
+                lines.append(f"      Issues: {len(node.issues)}")
+                lines.extend(f"         • {issue}" for issue in node.issues[:3])  # Show first 3 issues
                 if len(node.issues) > 3:
-                    print(f"         ... and {len(node.issues) - 3} more")
+                    lines.append(f"         ... and {len(node.issues) - 3} more")
 
-def main():
-    """Main execution function with CLI interface"""
+            # One write per node rather than one per field
+            print("\n".join(lines))
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser"""
     parser = argparse.ArgumentParser(description='Comprehensive Blockchain Sync Verification System')
-    parser.add_argument('--node-type', choices=['all', 'geth', 'erigon', 'nethermind', 'besu', 'lighthouse'],
+    parser.add_argument('--node-type', choices=('all', 'geth', 'erigon', 'nethermind', 'besu', 'lighthouse'),
                        default='all', help='Node client type to verify')
-    parser.add_argument('--network', choices=['mainnet', 'goerli', 'sepolia', 'holesky', 'all'],
+    parser.add_argument('--network', choices=('mainnet', 'goerli', 'sepolia', 'holesky', 'all'),
                        default='mainnet', help='Ethereum network')
-    parser.add_argument('--verification-level', choices=['basic', 'standard', 'comprehensive', 'forensic'],
+    parser.add_argument('--verification-level', choices=('basic', 'standard', 'comprehensive', 'forensic'),
                        default='standard', help='Depth of verification')
-    parser.add_argument('--alert-threshold', choices=['conservative', 'moderate', 'aggressive'],
+    parser.add_argument('--alert-threshold', choices=('conservative', 'moderate', 'aggressive'),
                        default='moderate', help='Alert threshold settings')
-    parser.add_argument('--output-format', choices=['json', 'yaml', 'table', 'dashboard'],
+    parser.add_argument('--output-format', choices=('json', 'yaml', 'table', 'dashboard'),
                        default='table', help='Output format')
     parser.add_argument('--duration', type=int, default=10, help='Monitoring duration in minutes')
     parser.add_argument('--compare-nodes', action='store_true', help='Compare cross-node consistency')
     parser.add_argument('--realtime', action='store_true', help='Enable real-time monitoring')
     parser.add_argument('--output-file', help='Output file path')
     parser.add_argument('--config', default='/etc/blockchain/sync_verifier.conf', help='Configuration file')
+    return parser
 
-    args = parser.parse_args()
+_PARSER = _build_parser()
+
+def main():
+    """Main execution function with CLI interface"""
+    args = _PARSER.parse_args()
 
     # Initialize verifier
     verifier = BlockchainSyncVerifier(args.config)
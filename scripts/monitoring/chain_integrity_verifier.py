@@ -13,15 +13,31 @@ Features:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import hashlib
 import json
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List, Tuple
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
-@dataclass
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# The chain head moves every ~12s, so a reference block number goes stale quickly
+_REF_BLOCK_TTL = 10.0
+_REF_BLOCK_FAILURE_TTL = 2.0
+
+def _hex_to_int(value: Optional[str]) -> int:
+    """Decode a JSON-RPC hex quantity such as '0x1b4'; missing values count as 0"""
+    return int(value, 16) if value else 0
+
+@dataclass(slots=True)
 class ChainIntegrityResult:
     """Chain integrity verification result"""
     node_name: str
@@ -52,6 +68,16 @@ class ChainIntegrityVerifier:
         self.cache = {}
         self.cache_timeout = 300  # 5 minutes
 
+        # Reference head per network as (expires_at, block_number), on the monotonic clock
+        self._ref_block_cache: Dict[str, Tuple[float, int]] = {}
+        self._ref_block_locks: Dict[str, threading.Lock] = {}
+
+        # One keep-alive pool for the local node RPCs and reference APIs
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
     def verify_chain_integrity(self, node_name: str, rpc_url: str, network: str = "mainnet",
                              verification_level: str = "standard") -> ChainIntegrityResult:
         """Comprehensive chain integrity verification"""
@@ -115,15 +141,24 @@ class ChainIntegrityVerifier:
 
     def get_reference_block_number(self, network: str) -> int:
         """Get reference block number from external sources"""
-        cache_key = f"reference_block_{network}"
-
-        # Check cache first
-        if cache_key in self.cache:
-            cached_data = self.cache[cache_key]
-            if time.time() - cached_data['timestamp'] < self.cache_timeout:
-                return cached_data['block_number']
-
-        # Try multiple sources
+        cached = self._ref_block_cache.get(network)
+        if cached and time.monotonic() < cached[0]:
+            return cached[1]
+
+        # Single-flight: concurrent checks of the same network wait on one lookup
+        with self._ref_block_locks.setdefault(network, threading.Lock()):
+            cached = self._ref_block_cache.get(network)
+            if cached and time.monotonic() < cached[0]:
+                return cached[1]
+
+            block_number = self._fetch_reference_block_number(network)
+            # Failures are remembered briefly so a down source isn't hammered
+            ttl = _REF_BLOCK_TTL if block_number > 0 else _REF_BLOCK_FAILURE_TTL
+            self._ref_block_cache[network] = (time.monotonic() + ttl, block_number)
+            return block_number
+
+    def _fetch_reference_block_number(self, network: str) -> int:
+        """Query the reference sources in order and return the first block number found"""
         sources = [
             self.get_etherscan_block,
             self.get_beaconchain_block,
@@ -134,11 +169,6 @@ class ChainIntegrityVerifier:
             try:
                 block_number = source_func(network)
                 if block_number > 0:
-                    # Cache the result
-                    self.cache[cache_key] = {
-                        'block_number': block_number,
-                        'timestamp': time.time()
-                    }
                     return block_number
             except Exception as e:
                 self.logger.warning(f"Failed to get reference from {source_func.__name__}: {e}")
@@ -163,12 +193,12 @@ class ChainIntegrityVerifier:
             'apikey': self.etherscan_api_key or 'YourApiKey'
         }
 
-        response = requests.get(base_url, params=params, timeout=10)
+        response = self.session.get(base_url, params=params, timeout=10)
         if response.status_code == 200:
-            data = response.json()
+            data = _json_loads(response.content)
             if data.get('status') == '1':
                 block_hex = data.get('result', '0x0')
-                return int(block_hex, 16) if block_hex != '0x0' else 0
+                return _hex_to_int(block_hex)
 
         return 0
 
@@ -185,9 +215,9 @@ class ChainIntegrityVerifier:
             return 0
 
         try:
-            response = requests.get(base_url, timeout=10)
+            response = self.session.get(base_url, timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 return data.get('data', {}).get('exec_block_number', 0)
         except Exception:
             pass
@@ -202,16 +232,16 @@ class ChainIntegrityVerifier:
     def get_local_block_number(self, rpc_url: str) -> int:
         """Get current block number from local node"""
         try:
-            response = requests.post(
+            response = self.session.post(
                 rpc_url,
                 json={"jsonrpc":"2.0","method":"eth_blockNumber","params":[],"id":1},
                 timeout=10
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 block_hex = data.get('result', '0x0')
-                return int(block_hex, 16) if block_hex != '0x0' else 0
+                return _hex_to_int(block_hex)
         except Exception as e:
             self.logger.error(f"Failed to get local block number: {e}")
 
@@ -220,8 +250,11 @@ class ChainIntegrityVerifier:
     def perform_comprehensive_integrity_checks(self, result: ChainIntegrityResult, rpc_url: str,
                                             local_block: int, reference_block: int, network: str):
         """Perform comprehensive integrity checks"""
+        # Hash, structure and state root all come from the same block, so fetch it once
+        block_data = self.get_block(rpc_url, local_block, full_transactions=True)
+
         # Verify block hash
-        local_hash = self.get_block_hash(rpc_url, local_block)
+        local_hash = block_data.get('hash') if block_data else None
         reference_hash = self.get_reference_block_hash(network, local_block)
 
         if local_hash and reference_hash:
@@ -231,14 +264,14 @@ class ChainIntegrityVerifier:
                 result.confidence_score -= 20.0
 
         # Verify chain work
-        result.chain_work_valid = self.verify_chain_work(rpc_url, local_block)
+        result.chain_work_valid = self.verify_chain_work(rpc_url, local_block, block_data)
         if not result.chain_work_valid:
             result.issues.append("Chain work verification failed")
             result.confidence_score -= 15.0
 
         # Validate state root for recent blocks
         if local_block > 0:
-            result.state_root_valid = self.validate_state_root(rpc_url, local_block)
+            result.state_root_valid = self.validate_state_root(rpc_url, local_block, block_data)
             if not result.state_root_valid:
                 result.issues.append("State root validation failed")
                 result.confidence_score -= 10.0
@@ -246,7 +279,7 @@ class ChainIntegrityVerifier:
     def get_block_hash(self, rpc_url: str, block_number: int) -> Optional[str]:
         """Get block hash for specific block number"""
         try:
-            response = requests.post(
+            response = self.session.post(
                 rpc_url,
                 json={
                     "jsonrpc":"2.0",
@@ -258,7 +291,7 @@ class ChainIntegrityVerifier:
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 block_data = data.get('result', {})
                 return block_data.get('hash', '')
         except Exception as e:
@@ -290,9 +323,9 @@ class ChainIntegrityVerifier:
                 'apikey': self.etherscan_api_key or 'YourApiKey'
             }
 
-            response = requests.get(base_url, params=params, timeout=10)
+            response = self.session.get(base_url, params=params, timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 if data.get('status') == '1':
                     result_data = data.get('result', {})
                     block_hash = result_data.get('hash', '')
@@ -308,58 +341,52 @@ class ChainIntegrityVerifier:
 
         return None
 
-    def verify_chain_work(self, rpc_url: str, block_number: int) -> bool:
-        """Verify chain work (simplified verification)"""
+    def get_block(self, rpc_url: str, block_number: int,
+                  full_transactions: bool = False) -> Optional[Dict[str, Any]]:
+        """Get a block by number from the local node"""
         try:
-            # Get block details to verify structure
-            response = requests.post(
+            response = self.session.post(
                 rpc_url,
                 json={
                     "jsonrpc":"2.0",
                     "method":"eth_getBlockByNumber",
-                    "params":[hex(block_number), True],
+                    "params":[hex(block_number), full_transactions],
                     "id":3
                 },
                 timeout=15
             )
 
             if response.status_code == 200:
-                data = response.json()
-                block_data = data.get('result', {})
-
-                # Basic structure validation
-                required_fields = ['hash', 'parentHash', 'number', 'timestamp', 'transactions']
-                return all(field in block_data for field in required_fields)
+                return _json_loads(response.content).get('result') or None
         except Exception as e:
-            self.logger.error(f"Chain work verification failed: {e}")
+            self.logger.error(f"Failed to get block {block_number}: {e}")
 
-        return False
+        return None
 
-    def validate_state_root(self, rpc_url: str, block_number: int) -> bool:
+    def verify_chain_work(self, rpc_url: str, block_number: int,
+                          block_data: Optional[Dict[str, Any]] = None) -> bool:
+        """Verify chain work (simplified verification)"""
+        # Get block details to verify structure
+        if block_data is None:
+            block_data = self.get_block(rpc_url, block_number, full_transactions=True)
+        if not block_data:
+            return False
+
+        # Basic structure validation
+        required_fields = ['hash', 'parentHash', 'number', 'timestamp', 'transactions']
+        return all(field in block_data for field in required_fields)
+
+    def validate_state_root(self, rpc_url: str, block_number: int,
+                            block_data: Optional[Dict[str, Any]] = None) -> bool:
         """Validate state root (basic validation)"""
-        try:
-            response = requests.post(
-                rpc_url,
-                json={
-                    "jsonrpc":"2.0",
-                    "method":"eth_getBlockByNumber",
-                    "params":[hex(block_number), True],
-                    "id":4
-                },
-                timeout=15
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                block_data = data.get('result', {})
-                state_root = block_data.get('stateRoot', '')
+        if block_data is None:
+            block_data = self.get_block(rpc_url, block_number, full_transactions=True)
+        if not block_data:
+            return False
 
-                # Basic validation - state root should be a valid 32-byte hash
-                return state_root.startswith('0x') and len(state_root) == 66
-        except Exception as e:
-            self.logger.error(f"State root validation failed: {e}")
-
-        return False
+        # Basic validation - state root should be a valid 32-byte hash
+        state_root = block_data.get('stateRoot', '')
+        return state_root.startswith('0x') and len(state_root) == 66
 
     def detect_reorganizations(self, rpc_url: str, current_block: int, network: str) -> Tuple[bool, int]:
         """Detect recent reorganizations"""
@@ -392,17 +419,32 @@ class ChainIntegrityVerifier:
     def verify_multiple_nodes(self, nodes: List[Dict[str, Any]], network: str = "mainnet",
                             verification_level: str = "standard") -> List[ChainIntegrityResult]:
         """Verify chain integrity for multiple nodes"""
-        results = []
-
-        for node in nodes:
-            result = self.verify_chain_integrity(
+        def verify(node: Dict[str, Any]) -> ChainIntegrityResult:
+            return self.verify_chain_integrity(
                 node_name=node['name'],
                 rpc_url=node['rpc_url'],
                 network=network,
                 verification_level=verification_level
             )
-            results.append(result)
 
+        # Node entries that share an RPC URL are the same backend, so each
+        # distinct URL is verified once and its result copied to the others
+        first_by_url: Dict[str, Dict[str, Any]] = {}
+        for node in nodes:
+            first_by_url.setdefault(node['rpc_url'], node)
+        unique_nodes = list(first_by_url.values())
+
+        # URLs are checked concurrently; each check is dominated by RPC and
+        # reference-API round-trips, so wall time is the slowest node
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(unique_nodes)))) as pool:
+            by_url = dict(zip(first_by_url, pool.map(verify, unique_nodes)))
+
+        results = []
+        for node in nodes:
+            result = by_url[node['rpc_url']]
+            if result.node_name != node['name']:
+                result = replace(result, node_name=node['name'], issues=list(result.issues))
+            results.append(result)
         return results
 
     def generate_integrity_report(self, results: List[ChainIntegrityResult]) -> Dict[str, Any]:
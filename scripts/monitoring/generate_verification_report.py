@@ -12,17 +12,19 @@ import time
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import TYPE_CHECKING, Dict, List, Any
 import argparse
 
+try:
+    import uvloop
+except ImportError:  # not available on Windows; fall back to the stock loop
+    uvloop = None
+
 # Add the current directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-try:
+if TYPE_CHECKING:
     from blockchain_sync_verification_comprehensive import BlockchainSyncVerifier
-except ImportError:
-    print("❌ Cannot import verification module")
-    sys.exit(1)
 
 class VerificationReportGenerator:
     """Comprehensive report generator with analytics"""
@@ -47,7 +49,7 @@ class VerificationReportGenerator:
                                           verification_level: str = "standard") -> str:
         """Generate comprehensive verification report"""
         print("📊 Generating Comprehensive Blockchain Verification Report...")
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         if networks is None:
             networks = ["mainnet", "sepolia", "holesky"]
@@ -62,17 +64,29 @@ class VerificationReportGenerator:
             "generator": "blockchain_sync_verification_system"
         }
 
+        # Imported here so --help and argument errors don't pay for loading the verifier
+        try:
+            from blockchain_sync_verification_comprehensive import BlockchainSyncVerifier
+        except ImportError:
+            print("❌ Cannot import verification module")
+            raise
+
         async with BlockchainSyncVerifier(self.config_file) as verifier:
-            # Analyze each network
-            network_results = {}
+            # Analyze all networks concurrently, then report in network order
             for network in networks:
                 print(f"🔍 Analyzing {network} network...")
-                try:
-                    result = await verifier.verify_cross_node_consistency(network)
+            results = await asyncio.gather(
+                *(verifier.verify_cross_node_consistency(network) for network in networks),
+                return_exceptions=True
+            )
+
+            network_results = {}
+            for network, result in zip(networks, results):
+                if isinstance(result, Exception):
+                    print(f"❌ Error analyzing {network}: {result}")
+                    network_results[network] = {"error": str(result)}
+                else:
                     network_results[network] = result
-                except Exception as e:
-                    print(f"❌ Error analyzing {network}: {e}")
-                    network_results[network] = {"error": str(e)}
 
             # Process results and generate analysis
             await self._process_network_results(network_results, verifier)
@@ -85,7 +99,7 @@ class VerificationReportGenerator:
                 await self._include_historical_data()
 
         # Calculate generation time
-        generation_time = time.time() - start_time
+        generation_time = time.perf_counter() - start_time
         self.report_data["metadata"]["generation_time_seconds"] = round(generation_time, 2)
 
         # Save report
@@ -101,7 +115,7 @@ class VerificationReportGenerator:
         return output_file
 
     async def _process_network_results(self, network_results: Dict[str, Any],
-                                      verifier: BlockchainSyncVerifier):
+                                      verifier: "BlockchainSyncVerifier"):
         """Process and analyze network results"""
         self.report_data["network_analysis"] = {}
 
@@ -413,7 +427,7 @@ class VerificationReportGenerator:
 
         self.report_data["recommendations"] = recommendations
 
-    async def _generate_appendix(self, verifier: BlockchainSyncVerifier):
+    async def _generate_appendix(self, verifier: "BlockchainSyncVerifier"):
         """Generate appendix with technical details"""
         self.report_data["appendix"] = {
             "configuration": {
@@ -442,13 +456,18 @@ class VerificationReportGenerator:
     async def _save_report(self, output_file: str):
         """Save report to file"""
         try:
-            Path(output_file).parent.mkdir(parents=True, exist_ok=True)
-            with open(output_file, 'w') as f:
-                json.dump(self.report_data, f, indent=2)
+            # Disk writes run in a worker thread so they don't stall the event loop
+            await asyncio.to_thread(self._write_report, output_file)
         except Exception as e:
             print(f"❌ Failed to save report: {e}")
             raise
 
+    def _write_report(self, output_file: str):
+        """Write the report JSON to disk (blocking)"""
+        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, 'w') as f:
+            json.dump(self.report_data, f, indent=2)
+
     def print_summary(self):
         """Print report summary to console"""
         executive_summary = self.report_data.get("executive_summary", {})
@@ -476,19 +495,24 @@ class VerificationReportGenerator:
                 priority_emoji = {"CRITICAL": "🚨", "HIGH": "⚠️", "MEDIUM": "⚡", "LOW": "💡"}.get(rec.get("priority"), "📝")
                 print(f"   {i}. {priority_emoji} {rec.get('recommendation', 'No recommendation')}")
 
-async def main():
-    """Main entry point"""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser"""
     parser = argparse.ArgumentParser(description="Generate comprehensive blockchain verification report")
-    parser.add_argument("--networks", nargs="+", choices=["mainnet", "sepolia", "holesky"],
+    parser.add_argument("--networks", nargs="+", choices=("mainnet", "sepolia", "holesky"),
                        default=["mainnet"], help="Networks to analyze")
     parser.add_argument("--output", help="Output file path")
     parser.add_argument("--include-historical", action="store_true", help="Include historical data")
-    parser.add_argument("--verification-level", choices=["basic", "standard", "comprehensive", "forensic"],
+    parser.add_argument("--verification-level", choices=("basic", "standard", "comprehensive", "forensic"),
                        default="standard", help="Verification depth")
     parser.add_argument("--config", default="/data/blockchain/nodes/sync_verifier.conf",
                        help="Configuration file path")
+    return parser
 
-    args = parser.parse_args()
+_PARSER = _build_parser()
+
+async def main():
+    """Main entry point"""
+    args = _PARSER.parse_args()
 
     generator = VerificationReportGenerator(args.config)
     output_file = await generator.generate_comprehensive_report(
@@ -503,6 +527,8 @@ async def main():
     print(f"\n📄 Full report available at: {output_file}")
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
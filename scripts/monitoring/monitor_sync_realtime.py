@@ -16,6 +16,20 @@ from pathlib import Path
 from blockchain_sync_verification_comprehensive import BlockchainSyncVerifier
 import argparse
 
+try:
+    import uvloop
+except ImportError:  # not available on Windows; fall back to the stock loop
+    uvloop = None
+
+try:
+    import orjson
+
+    def _ndjson_line(record: dict) -> bytes:
+        return orjson.dumps(record, default=str, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    def _ndjson_line(record: dict) -> bytes:
+        return (json.dumps(record, default=str) + "\n").encode()
+
 logger = logging.getLogger(__name__)
 
 class RealTimeMonitor:
@@ -35,43 +49,63 @@ class RealTimeMonitor:
                              export_interval: int = 10):
         """Start real-time monitoring with advanced features"""
         self.running = True
-        self.start_time = time.time()
+        # Elapsed/remaining math uses the monotonic clock so wall-clock
+        # adjustments (NTP steps, DST) can't stretch or cut the session
+        self.start_time = time.monotonic()
         end_time = self.start_time + (duration_minutes * 60)
         iteration = 0
 
-        print("🚀 BLOCKCHAIN SYNC REAL-TIME MONITOR")
-        print("=" * 80)
-        print(f"Duration: {duration_minutes} minutes")
-        print(f"Alert Threshold: {alert_threshold}")
-        print(f"Export Interval: {export_interval} minutes")
-        print(f"Networks: {', '.join(self.verifier.config.networks)}")
-        print(f"Node Types: {', '.join(self.verifier.config.node_types)}")
-        print("=" * 80)
+        if output_format == "json":
+            signal.signal(signal.SIGINT, self._quiet_signal_handler)
+            signal.signal(signal.SIGTERM, self._quiet_signal_handler)
+            await self._stream_json(end_time, alert_threshold, export_interval)
+            return
+
+        rule = "=" * 80
+        print(
+            f"🚀 BLOCKCHAIN SYNC REAL-TIME MONITOR\n{rule}\n"
+            f"Duration: {duration_minutes} minutes\n"
+            f"Alert Threshold: {alert_threshold}\n"
+            f"Export Interval: {export_interval} minutes\n"
+            f"Networks: {', '.join(self.verifier.config.networks)}\n"
+            f"Node Types: {', '.join(self.verifier.config.node_types)}\n"
+            f"{rule}"
+        )
 
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
 
         try:
-            while self.running and time.time() < end_time:
+            while self.running and (now := time.monotonic()) < end_time:
                 iteration += 1
+                # One wall-clock reading per iteration, shared by display, alerts and exports
                 timestamp = datetime.now()
-                elapsed = time.time() - self.start_time
+                elapsed = now - self.start_time
 
                 # Clear screen for dashboard view
                 if output_format == "dashboard":
                     self._clear_screen()
 
-                print(f"🕐 Iteration {iteration} - {timestamp.strftime('%H:%M:%S')}")
-                print(f"⏱️  Elapsed: {elapsed/60:.1f}m | Remaining: {max(0, (end_time - time.time())/60):.1f}m")
-                print("-" * 80)
+                print(
+                    f"🕐 Iteration {iteration} - {timestamp.strftime('%H:%M:%S')}\n"
+                    f"⏱️  Elapsed: {elapsed/60:.1f}m | Remaining: {max(0, (end_time - now)/60):.1f}m\n"
+                    + "-" * 80
+                )
+
+                # Check all networks concurrently; display stays sequential
+                networks = self.verifier.config.networks
+                consistencies = await asyncio.gather(
+                    *(self.verifier.verify_cross_node_consistency(network) for network in networks),
+                    return_exceptions=True
+                )
 
-                # Monitor all networks
                 network_results = {}
-                for network in self.verifier.config.networks:
+                for network, consistency in zip(networks, consistencies):
                     try:
                         print(f"\n📡 Checking {network.upper()} Network...")
-                        consistency = await self.verifier.verify_cross_node_consistency(network)
+                        if isinstance(consistency, Exception):
+                            raise consistency
                         network_results[network] = consistency
 
                         # Display results
@@ -101,8 +135,9 @@ class RealTimeMonitor:
                     await self._export_data(iteration, timestamp)
 
                 # Sleep until next iteration
-                if self.running and time.time() < end_time:
-                    sleep_time = min(30, end_time - time.time())
+                remaining = end_time - time.monotonic()
+                if self.running and remaining > 0:
+                    sleep_time = min(30, remaining)
                     print(f"\n⏳ Next check in {sleep_time}s... (Ctrl+C to stop)")
                     await asyncio.sleep(sleep_time)
 
@@ -116,6 +151,11 @@ class RealTimeMonitor:
         print(f"\n🛑 Received signal {signum}, shutting down gracefully...")
         self.running = False
 
+    def _quiet_signal_handler(self, signum, frame):
+        """Handle shutdown signals without writing to stdout, for JSON mode"""
+        logger.info(f"Received signal {signum}, shutting down gracefully")
+        self.running = False
+
     def _clear_screen(self):
         """Clear terminal screen"""
         import os
@@ -197,11 +237,52 @@ class RealTimeMonitor:
             avg_sync = sum(p.get("avg_sync", 0) for p in self.performance_history) / len(self.performance_history)
             print(f"   Average Health: {avg_health:.1f}% | Average Sync: {avg_sync:.1f}%")
 
-    def _handle_alerts(self, alerts: list, network: str, timestamp: datetime):
-        """Handle alerts with enhanced tracking"""
+    async def _stream_json(self, end_time: float, alert_threshold: str, export_interval: int):
+        """Write one JSON object per network per check to stdout, with no
+        banners or terminal formatting, for consumption by other tools
+
+        Alert counting, metrics collection and periodic exports run as in
+        the dashboard loop; only their terminal output is suppressed.
+        """
+        out = sys.stdout.buffer
+        networks = self.verifier.config.networks
+        iteration = 0
+
+        while self.running and time.monotonic() < end_time:
+            iteration += 1
+            timestamp = datetime.now()
+            consistencies = await asyncio.gather(
+                *(self.verifier.verify_cross_node_consistency(network) for network in networks),
+                return_exceptions=True
+            )
+
+            for network, consistency in zip(networks, consistencies):
+                record = {"timestamp": timestamp.isoformat(), "network": network}
+                if isinstance(consistency, Exception):
+                    record["error"] = str(consistency)
+                else:
+                    alerts = self.verifier.check_alerts(consistency, alert_threshold)
+                    self._handle_alerts(alerts, network, timestamp, quiet=True)
+                    self._collect_performance_metrics(consistency, timestamp)
+                    record["result"] = consistency
+                    record["alerts"] = alerts
+                out.write(_ndjson_line(record))
+            out.flush()
+
+            if iteration % (export_interval * 2) == 0:  # Every export_interval minutes
+                await self._export_data(iteration, timestamp, quiet=True)
+
+            remaining = end_time - time.monotonic()
+            if self.running and remaining > 0:
+                await asyncio.sleep(min(30, remaining))
+
+    def _handle_alerts(self, alerts: list, network: str, timestamp: datetime, quiet: bool = False):
+        """Handle alerts with enhanced tracking; quiet skips the terminal display"""
         for alert in alerts:
             alert_type = alert.get("type", "INFO")
             self.alert_counts[alert_type] += 1
+            if quiet:
+                continue
 
             # Enhanced alert display
             node = alert.get("node", "")
@@ -248,34 +329,46 @@ class RealTimeMonitor:
         if len(self.performance_history) > 100:
             self.performance_history = self.performance_history[-100:]
 
-    async def _export_data(self, iteration: int, timestamp: datetime):
-        """Export monitoring data to files"""
+    async def _export_data(self, iteration: int, timestamp: datetime, quiet: bool = False):
+        """Export monitoring data to files; quiet reports only failures, via the log"""
         try:
-            # Create export directory
-            export_dir = Path("/var/log/blockchain_monitoring")
-            export_dir.mkdir(parents=True, exist_ok=True)
-
-            # Export performance history
-            perf_file = export_dir / f"performance_{timestamp.strftime('%Y%m%d_%H%M%S')}.json"
-            with open(perf_file, 'w') as f:
-                json.dump(self.performance_history, f, indent=2)
-
-            # Export alert summary
-            alert_file = export_dir / f"alerts_{timestamp.strftime('%Y%m%d_%H%M%S')}.json"
             alert_summary = {
                 "timestamp": timestamp.isoformat(),
                 "iteration": iteration,
                 "alert_counts": self.alert_counts,
                 "recent_alerts": self.verifier.alert_history[-20:]  # Last 20 alerts
             }
-            with open(alert_file, 'w') as f:
-                json.dump(alert_summary, f, indent=2)
+
+            # Disk writes run in a worker thread so they don't stall the event loop
+            export_dir = await asyncio.to_thread(self._write_export_files, timestamp, alert_summary)
 
             self.last_export = timestamp
-            print(f"💾 Data exported to {export_dir}")
+            if not quiet:
+                print(f"💾 Data exported to {export_dir}")
 
         except Exception as e:
-            print(f"❌ Failed to export data: {e}")
+            if quiet:
+                logger.error(f"Failed to export data: {e}")
+            else:
+                print(f"❌ Failed to export data: {e}")
+
+    def _write_export_files(self, timestamp: datetime, alert_summary: dict) -> Path:
+        """Write performance history and alert summary to disk (blocking)"""
+        # Create export directory
+        export_dir = Path("/var/log/blockchain_monitoring")
+        export_dir.mkdir(parents=True, exist_ok=True)
+
+        # Export performance history
+        perf_file = export_dir / f"performance_{timestamp.strftime('%Y%m%d_%H%M%S')}.json"
+        with open(perf_file, 'w') as f:
+            json.dump(self.performance_history, f, indent=2)
+
+        # Export alert summary
+        alert_file = export_dir / f"alerts_{timestamp.strftime('%Y%m%d_%H%M%S')}.json"
+        with open(alert_file, 'w') as f:
+            json.dump(alert_summary, f, indent=2)
+
+        return export_dir
 
     async def _shutdown_monitoring(self, iteration: int):
         """Clean shutdown and final report"""
@@ -284,7 +377,7 @@ class RealTimeMonitor:
         print("=" * 80)
 
         if self.start_time:
-            duration = time.time() - self.start_time
+            duration = time.monotonic() - self.start_time
             print(f"Total Duration: {duration/60:.1f} minutes")
             print(f"Total Iterations: {iteration}")
 
@@ -308,19 +401,24 @@ class RealTimeMonitor:
             print(f"   Average Health Score: {avg_health:.1f}%")
             print(f"   Average Sync Progress: {avg_sync:.1f}%")
 
-async def main():
-    """Main entry point"""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser"""
     parser = argparse.ArgumentParser(description="Real-time Blockchain Sync Monitor")
     parser.add_argument("--duration", type=int, default=60, help="Monitoring duration in minutes")
-    parser.add_argument("--alert-threshold", choices=["conservative", "moderate", "aggressive"],
+    parser.add_argument("--alert-threshold", choices=("conservative", "moderate", "aggressive"),
                        default="moderate", help="Alert sensitivity")
-    parser.add_argument("--output-format", choices=["dashboard", "table", "json"],
+    parser.add_argument("--output-format", choices=("dashboard", "table", "json"),
                        default="dashboard", help="Output format")
     parser.add_argument("--export-interval", type=int, default=10, help="Export data every N minutes")
     parser.add_argument("--config", default="/data/blockchain/nodes/sync_verifier.conf",
                        help="Configuration file path")
+    return parser
 
-    args = parser.parse_args()
+_PARSER = _build_parser()
+
+async def main():
+    """Main entry point"""
+    args = _PARSER.parse_args()
 
     # Create and start monitor
     monitor = RealTimeMonitor(args.config)
@@ -332,6 +430,8 @@ async def main():
     )
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
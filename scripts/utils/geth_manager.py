@@ -35,6 +35,11 @@ import psutil
 import toml
 import jsonschema
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 # Configure logging with proper error handling
 def setup_logging():
     """Setup logging with error handling for permission issues"""
@@ -239,7 +244,7 @@ class GethManager:
         try:
             if os.path.exists(self.config_file):
                 with open(self.config_file, 'r') as f:
-                    data = yaml.safe_load(f)
+                    data = yaml.load(f, Loader=_YamlLoader)
                     
                 # Map YAML structure to dataclass
                 config_data = {}